@@ -0,0 +1,322 @@
+#!/usr/bin/env python3
+"""
+Benchmark suite for the Complex GUI Application
+Drives ComplexGUIApp through fixed scenarios and reports wall time,
+frame-time percentiles and Tcl call counts as JSON
+"""
+
+import argparse
+import atexit
+import json
+import os
+import platform
+import random
+import shutil
+import subprocess
+import sys
+import time
+
+
+COMPARABLE_META = ("backend", "frame_rate", "navigations", "toggles", "hover_items", "chart_points", "stream_seconds")
+
+
+class TclCallCounter:
+    def __init__(self, tkapp):
+        self._tkapp = tkapp
+        self.calls = 0
+    
+    def call(self, *args):
+        self.calls += 1
+        return self._tkapp.call(*args)
+    
+    def __getattr__(self, name):
+        return getattr(self._tkapp, name)
+
+
+def start_xvfb():
+    xvfb = shutil.which("Xvfb")
+    if not xvfb:
+        raise SystemExit("No DISPLAY set and Xvfb is not installed")
+    
+    for number in range(99, 120):
+        if os.path.exists(f"/tmp/.X11-unix/X{number}") or os.path.exists(f"/tmp/.X{number}-lock"):
+            continue
+        process = subprocess.Popen(
+            [xvfb, f":{number}", "-screen", "0", "1600x1000x24", "-nolisten", "tcp"],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL
+        )
+        atexit.register(process.terminate)
+        deadline = time.monotonic() + 5
+        while time.monotonic() < deadline:
+            if os.path.exists(f"/tmp/.X11-unix/X{number}"):
+                os.environ["DISPLAY"] = f":{number}"
+                return process
+            if process.poll() is not None:
+                break
+            time.sleep(0.05)
+        process.terminate()
+    raise SystemExit("Could not start Xvfb")
+
+
+def pump_for(app, seconds):
+    clock = app.animation_engine.clock
+    if hasattr(clock, "advance"):
+        clock.advance(seconds)
+        return
+    root = app.root
+    done = []
+    root.after(int(seconds * 1000), lambda: done.append(True))
+    while not done:
+        root.tk.dooneevent(0)
+
+
+def settle(app):
+    clock = app.animation_engine.clock
+    if hasattr(clock, "run_until_idle"):
+        clock.run_until_idle()
+        return
+    while not app.animation_engine.is_idle():
+        app.root.tk.dooneevent(0)
+    app.root.update_idletasks()
+
+
+def collect(app, wall_time):
+    stats = app.animation_engine.stats.snapshot()
+    counter = getattr(app.root, "tk", None)
+    return {
+        "wall_ms": wall_time * 1000,
+        "frame_ms": stats["frame_interval_ms"],
+        "late_frames": stats["late_frames"],
+        "dropped_frames": stats["dropped_frames"],
+        "tcl_calls": counter.calls if isinstance(counter, TclCallCounter) else app.root.log.total(),
+    }
+
+
+def reset(app):
+    app.animation_engine.stats.reset()
+    counter = getattr(app.root, "tk", None)
+    if isinstance(counter, TclCallCounter):
+        counter.calls = 0
+    else:
+        app.root.log.reset()
+
+
+def run_scenario(app, scenario):
+    reset(app)
+    start = time.perf_counter()
+    scenario()
+    settle(app)
+    return collect(app, time.perf_counter() - start)
+
+
+def bench_startup(tk, ComplexGUIApp, frame_rate, null_backend):
+    start = time.perf_counter()
+    if null_backend:
+        root = tk.Tk(keep_entries=False)
+        app = ComplexGUIApp(root, enable_frame_stats=True, clock=root.clock, frame_rate=frame_rate)
+    else:
+        root = tk.Tk()
+        root.tk = TclCallCounter(root.tk)
+        app = ComplexGUIApp(root, enable_frame_stats=True, frame_rate=frame_rate)
+    root.update()
+    first_paint = time.perf_counter() - start
+    settle(app)
+    result = collect(app, first_paint)
+    result["settled_ms"] = (time.perf_counter() - start) * 1000
+    return app, result
+
+
+def bench_navigation(app, count):
+    pages = ["dashboard", "settings", "about", "home"]
+    
+    def scenario():
+        for i in range(count):
+            app.navigate_to_page(pages[i % len(pages)])
+            settle(app)
+    
+    return run_scenario(app, scenario)
+
+
+def bench_sidebar_toggle(app, count):
+    def scenario():
+        for i in range(count):
+            app.sidebar.toggle()
+            settle(app)
+    
+    return run_scenario(app, scenario)
+
+
+def bench_hover_sweep(app, count):
+    items = app.sidebar.menu_items
+    frame_interval = app.animation_engine.frame_interval
+    
+    def scenario():
+        for i in range(count):
+            item = items[i % len(items)]
+            item.on_enter(None)
+            pump_for(app, frame_interval)
+            item.on_leave(None)
+    
+    return run_scenario(app, scenario)
+
+
+def bench_chart_redraw(app, points):
+    app.navigate_to_page("dashboard")
+    settle(app)
+    dashboard = app.views["dashboard"]
+    rng = random.Random(42)
+    data = [rng.randint(10, 100) for i in range(points)]
+    
+    def scenario():
+        dashboard.redraw_chart(data)
+    
+    return run_scenario(app, scenario)
+
+
+def bench_streaming(app, seconds):
+    app.navigate_to_page("dashboard")
+    settle(app)
+    dashboard = app.views["dashboard"]
+    stream = dashboard.start_stream()
+    rng = random.Random(7)
+    feeding = [True]
+    
+    def feed():
+        stream.append(rng.uniform(0, 90))
+        if feeding[0]:
+            app.root.after(1, feed)
+    
+    def scenario():
+        app.root.after(1, feed)
+        pump_for(app, seconds)
+        feeding[0] = False
+    
+    cpu_start = time.thread_time()
+    result = run_scenario(app, scenario)
+    result["samples"] = stream.buffer.total
+    if not hasattr(app.animation_engine.clock, "advance"):
+        result["load"] = (time.thread_time() - cpu_start) / seconds
+    dashboard.stop_stream()
+    return result
+
+
+def run_benchmarks(args):
+    if args.null:
+        import complex_gui_app
+        import null_tk as tk
+        complex_gui_app.use_backend(tk)
+    else:
+        if not os.environ.get("DISPLAY"):
+            start_xvfb()
+        import tkinter as tk
+    from complex_gui_app import ComplexGUIApp
+    
+    results = {}
+    app, results["startup"] = bench_startup(tk, ComplexGUIApp, args.frame_rate, args.null)
+    results["navigation"] = bench_navigation(app, args.navigations)
+    results["sidebar_toggle"] = bench_sidebar_toggle(app, args.toggles)
+    results["hover_sweep"] = bench_hover_sweep(app, args.hover_items)
+    results["chart_redraw"] = bench_chart_redraw(app, args.chart_points)
+    results["streaming"] = bench_streaming(app, args.stream_seconds)
+    app.root.destroy()
+    
+    return {
+        "meta": {
+            "backend": "null" if args.null else "tk",
+            "python": platform.python_version(),
+            "tk": tk.TkVersion,
+            "platform": platform.platform(),
+            "frame_rate": args.frame_rate,
+            "navigations": args.navigations,
+            "toggles": args.toggles,
+            "hover_items": args.hover_items,
+            "chart_points": args.chart_points,
+            "stream_seconds": args.stream_seconds,
+        },
+        "scenarios": results,
+    }
+
+
+def meta_mismatches(results, baseline):
+    current = results["meta"]
+    previous = baseline.get("meta", {})
+    return {key: (previous.get(key), current[key]) for key in COMPARABLE_META if previous.get(key) != current[key]}
+
+
+def compare(results, baseline, tolerance):
+    regressions = []
+    for name, current in results["scenarios"].items():
+        previous = baseline.get("scenarios", {}).get(name)
+        if previous is None:
+            continue
+        metrics = [
+            ("wall_ms", current["wall_ms"], previous["wall_ms"]),
+            ("frame_ms.p99", current["frame_ms"]["p99"], previous["frame_ms"]["p99"]),
+            ("tcl_calls", current["tcl_calls"], previous["tcl_calls"]),
+        ]
+        for metric, value, reference in metrics:
+            if reference and value > reference * (1 + tolerance):
+                regressions.append({
+                    "scenario": name,
+                    "metric": metric,
+                    "baseline": reference,
+                    "current": value,
+                    "change": value / reference - 1,
+                })
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the Complex GUI Application")
+    parser.add_argument("--navigations", type=int, default=20)
+    parser.add_argument("--toggles", type=int, default=4)
+    parser.add_argument("--hover-items", type=int, default=40)
+    parser.add_argument("--chart-points", type=int, default=1000)
+    parser.add_argument("--stream-seconds", type=float, default=2.0, help="duration of the 1 kHz streaming chart scenario")
+    parser.add_argument("--frame-rate", type=int, default=60)
+    parser.add_argument("--null", action="store_true", help="run on the display-free null Tk backend with a virtual clock")
+    parser.add_argument("--output", help="write results JSON to this file instead of stdout")
+    parser.add_argument("--baseline", default="bench_baseline.json")
+    parser.add_argument("--save-baseline", action="store_true", help="store these results as the new baseline")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="allowed relative slowdown, default 20%%")
+    args = parser.parse_args()
+    
+    results = run_benchmarks(args)
+    
+    regressions = []
+    mismatches = {}
+    if args.save_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as baseline_file:
+            json.dump(results, baseline_file, indent=2)
+    elif os.path.exists(args.baseline):
+        with open(args.baseline, encoding="utf-8") as baseline_file:
+            baseline = json.load(baseline_file)
+        mismatches = meta_mismatches(results, baseline)
+        if not mismatches:
+            regressions = compare(results, baseline, args.tolerance)
+            results["regressions"] = regressions
+    
+    output = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as output_file:
+            output_file.write(output)
+    else:
+        print(output)
+    
+    for key, (previous, current) in mismatches.items():
+        print(f"BASELINE MISMATCH {key}: {previous} != {current}", file=sys.stderr)
+    if mismatches:
+        print(f"{args.baseline} was recorded with different settings; rerun with --save-baseline", file=sys.stderr)
+        sys.exit(2)
+    for regression in regressions:
+        print(
+            f"REGRESSION {regression['scenario']} {regression['metric']}: "
+            f"{regression['baseline']:.2f} -> {regression['current']:.2f} ({regression['change']:+.0%})",
+            file=sys.stderr
+        )
+    sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
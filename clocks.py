@@ -0,0 +1,72 @@
+"""
+Clocks for the Complex GUI Application
+TkClock schedules on the Tk event loop in real time; VirtualClock keeps
+its own time and callback queue for display-free, deterministic runs
+"""
+
+import heapq
+import itertools
+import time
+
+
+class TkClock:
+    def __init__(self, root):
+        self.root = root
+    
+    def now(self):
+        return time.monotonic()
+    
+    def after(self, delay_ms, callback):
+        return self.root.after(delay_ms, callback)
+    
+    def after_cancel(self, after_id):
+        self.root.after_cancel(after_id)
+
+
+class VirtualClock:
+    def __init__(self, start_time=0.0):
+        self.time = start_time
+        self.queue = []
+        self.counter = itertools.count()
+        self.waiting = set()
+        self.cancelled = set()
+    
+    def now(self):
+        return self.time
+    
+    def after(self, delay_ms, callback):
+        after_id = next(self.counter)
+        heapq.heappush(self.queue, (self.time + delay_ms / 1000.0, after_id, callback))
+        self.waiting.add(after_id)
+        return after_id
+    
+    def after_cancel(self, after_id):
+        if after_id in self.waiting:
+            self.waiting.discard(after_id)
+            self.cancelled.add(after_id)
+    
+    def pending(self):
+        return len(self.waiting)
+    
+    def run_next(self):
+        due, after_id, callback = heapq.heappop(self.queue)
+        if after_id in self.cancelled:
+            self.cancelled.discard(after_id)
+            return
+        self.waiting.discard(after_id)
+        self.time = max(self.time, due)
+        callback()
+    
+    def advance(self, seconds):
+        target = self.time + seconds
+        while self.queue and self.queue[0][0] <= target:
+            self.run_next()
+        self.time = target
+    
+    def run_until_idle(self, timeout=60.0):
+        start = self.time
+        while self.queue:
+            if self.queue[0][0] - start > timeout:
+                raise RuntimeError(f"Callbacks still pending after {timeout}s of virtual time")
+            self.run_next()
+        return self.time - start
@@ -1,13 +1,265 @@
+import time
+IMPORT_STARTED = time.perf_counter()
 import tkinter as tk
 from tkinter import ttk
-import time
+TKINTER_IMPORTED = time.perf_counter()
 import math
+import os
+import sys
+import json
+import threading
+import bisect
+import heapq
+import random
+import traceback
+from array import array
+from collections import Counter, deque
+from itertools import compress
+
+from clocks import TkClock, VirtualClock
+
+
+def use_backend(backend):
+    global tk
+    tk = backend
+
+
+def decimate_max(data, buckets):
+    if len(data) <= buckets:
+        return list(data)
+    count = len(data)
+    return [max(data[i * count // buckets:(i + 1) * count // buckets]) for i in range(buckets)]
+
+
+class NullSpan:
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        return False
+
+
+class TraceSpan:
+    def __init__(self, tracer, name):
+        self.tracer = tracer
+        self.name = name
+    
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.tracer.add_span(self.name, self.start, time.perf_counter())
+        return False
+
+
+class StartupTracer:
+    null_span = NullSpan()
+    
+    def __init__(self, path=None):
+        self.path = path
+        self.enabled = bool(path)
+        self.events = []
+        self.process_start = self.find_process_start() if self.enabled else IMPORT_STARTED
+    
+    def find_process_start(self):
+        try:
+            with open("/proc/self/stat", encoding="ascii") as stat_file:
+                start_ticks = int(stat_file.read().rsplit(")", 1)[1].split()[19])
+            with open("/proc/uptime", encoding="ascii") as uptime_file:
+                uptime = float(uptime_file.read().split()[0])
+            age = uptime - start_ticks / os.sysconf("SC_CLK_TCK")
+            return min(time.perf_counter() - age, IMPORT_STARTED)
+        except (OSError, ValueError, IndexError, AttributeError):
+            return IMPORT_STARTED
+    
+    def span(self, name):
+        if not self.enabled:
+            return self.null_span
+        return TraceSpan(self, name)
+    
+    def add_span(self, name, start, end):
+        if self.enabled:
+            self.events.append((name, start, end))
+    
+    def mark(self, name):
+        now = time.perf_counter()
+        self.add_span(name, now, now)
+    
+    def summary(self):
+        return {name: (end - start) * 1000 for name, start, end in self.events}
+    
+    def to_chrome_trace(self):
+        pid = os.getpid()
+        tid = threading.get_ident()
+        trace_events = [{"name": "process_name", "ph": "M", "pid": pid, "tid": tid,
+                         "args": {"name": "complex_gui_app startup"}}]
+        for name, start, end in self.events:
+            event = {
+                "name": name,
+                "cat": "startup",
+                "ph": "X" if end > start else "i",
+                "ts": (start - self.process_start) * 1e6,
+                "pid": pid,
+                "tid": tid,
+            }
+            if end > start:
+                event["dur"] = (end - start) * 1e6
+            else:
+                event["s"] = "p"
+            trace_events.append(event)
+        return {"traceEvents": trace_events, "displayTimeUnit": "ms"}
+    
+    def write(self):
+        if not self.enabled:
+            return
+        self.enabled = False
+        with open(self.path, "w", encoding="utf-8") as trace_file:
+            json.dump(self.to_chrome_trace(), trace_file)
+
+
+class Histogram:
+    def __init__(self, bucket_width=0.5, max_value=250.0):
+        self.bucket_width = bucket_width
+        self.buckets = [0] * (int(max_value / bucket_width) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+    
+    def add(self, value):
+        index = min(int(value / self.bucket_width), len(self.buckets) - 1)
+        self.buckets[index] += 1
+        self.count += 1
+        self.total += value
+        if value > self.max:
+            self.max = value
+    
+    def percentile(self, p):
+        if not self.count:
+            return 0.0
+        rank = p / 100.0 * self.count
+        seen = 0
+        for index, bucket_count in enumerate(self.buckets):
+            seen += bucket_count
+            if seen >= rank and bucket_count:
+                return min((index + 1) * self.bucket_width, self.max)
+        return self.max
+    
+    def to_dict(self):
+        return {
+            "count": self.count,
+            "mean": self.total / self.count if self.count else 0.0,
+            "max": self.max,
+            "p50": self.percentile(50),
+            "p90": self.percentile(90),
+            "p99": self.percentile(99),
+        }
+
+
+class FrameStats:
+    def __init__(self, target_interval=1.0 / 60):
+        self.target_interval = target_interval
+        self.reset()
+    
+    def reset(self):
+        self.frame_intervals = Histogram()
+        self.late_frames = 0
+        self.dropped_frames = 0
+        self.labels = {}
+    
+    def label_stats(self, label):
+        stats = self.labels.get(label)
+        if stats is None:
+            stats = self.labels[label] = {
+                "frames": 0,
+                "late_frames": 0,
+                "dropped_frames": 0,
+                "interval_ms": Histogram(),
+                "cpu_ms": Histogram(),
+                "wall_ms": Histogram(),
+            }
+        return stats
+    
+    def dropped(self, interval):
+        if interval > self.target_interval * 1.5:
+            return int(interval / self.target_interval) - 1
+        return None
+    
+    def record_frame(self, interval):
+        self.frame_intervals.add(interval * 1000)
+        dropped = self.dropped(interval)
+        if dropped is not None:
+            self.late_frames += 1
+            self.dropped_frames += dropped
+    
+    def record_label_frame(self, label, interval):
+        stats = self.label_stats(label)
+        stats["frames"] += 1
+        stats["interval_ms"].add(interval * 1000)
+        dropped = self.dropped(interval)
+        if dropped is not None:
+            stats["late_frames"] += 1
+            stats["dropped_frames"] += dropped
+    
+    def record_callback(self, label, cpu_time, wall_time):
+        stats = self.label_stats(label)
+        stats["cpu_ms"].add(cpu_time * 1000)
+        stats["wall_ms"].add(wall_time * 1000)
+    
+    def snapshot(self):
+        return {
+            "target_interval_ms": self.target_interval * 1000,
+            "frame_interval_ms": self.frame_intervals.to_dict(),
+            "late_frames": self.late_frames,
+            "dropped_frames": self.dropped_frames,
+            "labels": {
+                label: {
+                    key: value.to_dict() if isinstance(value, Histogram) else value
+                    for key, value in stats.items()
+                }
+                for label, stats in self.labels.items()
+            },
+        }
+    
+    def dump_json(self, path):
+        with open(path, "w", encoding="utf-8") as output:
+            json.dump(self.snapshot(), output, indent=2)
 
 
 class AnimationEngine:
-    def __init__(self, root):
+    FRAME_RATES = (30, 60, 120)
+    
+    def __init__(self, root, clock=None, frame_rate=60):
         self.root = root
+        self.clock = clock or TkClock(root)
         self.animations = []
+        self.stats = None
+        self.stats_frame = None
+        self.epoch = self.clock.now()
+        self.frame_interval = None
+        self.set_frame_rate(frame_rate)
+    
+    def set_frame_rate(self, frame_rate):
+        if frame_rate not in self.FRAME_RATES:
+            raise ValueError(f"Unsupported frame rate {frame_rate}, expected one of {self.FRAME_RATES}")
+        frame_interval = 1.0 / frame_rate
+        if self.frame_interval is not None:
+            now = self.clock.now()
+            self.epoch = now - self.frame_index(now) * frame_interval
+        self.frame_rate = frame_rate
+        self.frame_interval = frame_interval
+        if self.stats is not None:
+            self.stats.target_interval = self.frame_interval
+    
+    def frame_index(self, now):
+        return int((now - self.epoch) / self.frame_interval)
+    
+    def schedule_frame(self, last_index, callback):
+        now = self.clock.now()
+        next_index = max(last_index + 1, self.frame_index(now) + 1)
+        deadline = self.epoch + next_index * self.frame_interval
+        self.clock.after(max(0, int(round((deadline - now) * 1000))), callback)
+        return next_index
     
     def ease_in_out_cubic(self, t):
         if t < 0.5:
@@ -15,32 +267,458 @@ class AnimationEngine:
         else:
             return 1 - pow(-2 * t + 2, 3) / 2
     
-    def animate(self, duration, callback, on_complete=None):
-        start_time = time.time()
+    def enable_instrumentation(self):
+        if self.stats is None:
+            self.stats = FrameStats(self.frame_interval)
+        return self.stats
+    
+    def disable_instrumentation(self):
+        self.stats = None
+    
+    def animate(self, duration, callback, on_complete=None, label=None):
+        start_time = self.clock.now()
+        if label is None:
+            label = getattr(callback, "__qualname__", repr(callback))
+        animation = {"callback": callback, "label": label, "duration": duration, "start_time": start_time}
+        self.animations.append(animation)
+        last_frame = None
+        target_index = self.frame_index(start_time)
         
         def step():
-            elapsed = time.time() - start_time
+            nonlocal last_frame, target_index
+            elapsed = self.clock.now() - start_time
             progress = min(elapsed / duration, 1.0)
             eased_progress = self.ease_in_out_cubic(progress)
             
-            callback(eased_progress)
+            stats = self.stats
+            if stats is None:
+                callback(eased_progress)
+            else:
+                frame_start = start_time + elapsed
+                self.record_engine_frame(stats, target_index, frame_start)
+                if last_frame is not None:
+                    stats.record_label_frame(label, frame_start - last_frame)
+                last_frame = frame_start
+                wall_start = time.perf_counter()
+                cpu_start = time.thread_time()
+                callback(eased_progress)
+                stats.record_callback(label, time.thread_time() - cpu_start, time.perf_counter() - wall_start)
             
             if progress < 1.0:
-                self.root.after(16, step)
+                target_index = self.schedule_frame(target_index, step)
             else:
+                self.animations.remove(animation)
+                if not self.animations:
+                    self.stats_frame = None
                 if on_complete:
                     on_complete()
         
         step()
+    
+    def record_engine_frame(self, stats, index, frame_start):
+        if self.stats_frame is not None:
+            last_index, last_start = self.stats_frame
+            if index == last_index:
+                return
+            stats.record_frame(frame_start - last_start)
+        self.stats_frame = (index, frame_start)
+    
+    def is_idle(self):
+        return not self.animations
+    
+    def describe_active(self):
+        return [animation["label"] for animation in list(self.animations)]
+
+
+class StallWatchdog:
+    default_log_path = os.path.expanduser("~/.complex_gui_stalls.log")
+    
+    def __init__(self, root, animation_engine=None, threshold=0.25, heartbeat_interval=0.05,
+                 capacity=100, log_path=default_log_path):
+        self.root = root
+        self.animation_engine = animation_engine
+        self.threshold = threshold
+        self.heartbeat_interval = heartbeat_interval
+        self.log_path = log_path
+        self.events = deque(maxlen=capacity)
+        self.main_thread_id = None
+        self.last_heartbeat = time.monotonic()
+        self.heartbeat_id = None
+        self.thread = None
+        self.stop_event = threading.Event()
+        self.lock = threading.Lock()
+    
+    def start(self):
+        if self.thread is not None:
+            return
+        self.main_thread_id = threading.get_ident()
+        self.stop_event.clear()
+        self.heartbeat()
+        self.thread = threading.Thread(target=self.run, name="StallWatchdog", daemon=True)
+        self.thread.start()
+    
+    def stop(self):
+        self.stop_event.set()
+        if self.heartbeat_id is not None:
+            try:
+                self.root.after_cancel(self.heartbeat_id)
+            except tk.TclError:
+                pass
+            self.heartbeat_id = None
+        if self.thread is not None:
+            self.thread.join(timeout=1.0)
+            self.thread = None
+    
+    def heartbeat(self):
+        self.last_heartbeat = time.monotonic()
+        if not self.stop_event.is_set():
+            self.heartbeat_id = self.root.after(int(self.heartbeat_interval * 1000), self.heartbeat)
+    
+    def run(self):
+        poll_interval = min(self.heartbeat_interval, self.threshold / 4)
+        stall_start = None
+        stall_wall_time = None
+        stacks = Counter()
+        animations = []
+        
+        while not self.stop_event.wait(poll_interval):
+            last_heartbeat = self.last_heartbeat
+            lag = time.monotonic() - last_heartbeat
+            
+            if lag > self.threshold + self.heartbeat_interval:
+                if stall_start is None:
+                    stall_start = last_heartbeat + self.heartbeat_interval
+                    stall_wall_time = time.time() - lag + self.heartbeat_interval
+                    animations = self.sample_animations()
+                stack = self.sample_main_stack()
+                if stack:
+                    stacks[stack] += 1
+            elif stall_start is not None:
+                self.record(stall_wall_time, last_heartbeat - stall_start, stacks, animations)
+                stall_start = None
+                stacks = Counter()
+                animations = []
+    
+    def sample_main_stack(self):
+        frame = sys._current_frames().get(self.main_thread_id)
+        if frame is None:
+            return None
+        return tuple(traceback.format_stack(frame))
+    
+    def sample_animations(self):
+        if self.animation_engine is None:
+            return []
+        return self.animation_engine.describe_active()
+    
+    def record(self, wall_time, duration, stacks, animations):
+        stack, samples = stacks.most_common(1)[0] if stacks else ((), 0)
+        event = {
+            "time": wall_time,
+            "duration": duration,
+            "samples": samples,
+            "stack": list(stack),
+            "animations": animations,
+        }
+        with self.lock:
+            self.events.append(event)
+        if self.log_path:
+            try:
+                with open(self.log_path, "a", encoding="utf-8") as log_file:
+                    log_file.write(json.dumps(event) + "\n")
+            except OSError:
+                pass
+    
+    def get_events(self):
+        with self.lock:
+            return list(self.events)
+
+
+class TclCallProxy:
+    def __init__(self, tkapp, profiler):
+        self._tkapp = tkapp
+        self._profiler = profiler
+        self.enabled = True
+    
+    def call(self, *args):
+        if not self.enabled:
+            return self._tkapp.call(*args)
+        return self._profiler.profile_call(self._tkapp, args)
+    
+    def __getattr__(self, name):
+        return getattr(self._tkapp, name)
+
+
+class TclProfiler:
+    SUBCOMMANDS = ("after", "font", "grid", "image", "pack", "place", "winfo", "wm")
+    
+    def __init__(self, root, frame_interval=16):
+        self.root = root
+        self.frame_interval = frame_interval
+        self.tkapp = None
+        self.proxy = None
+        self.frame_id = None
+        self.depth = 0
+        self.child_time = []
+        self.reset()
+    
+    def reset(self):
+        self.calls = {}
+        self.frame_calls = 0
+        self.frame_time = 0.0
+        self.calls_per_frame = Histogram(bucket_width=1, max_value=1000)
+        self.time_per_frame = Histogram()
+    
+    def install(self):
+        if self.tkapp is not None:
+            return
+        self.tkapp = self.root.tk
+        self.proxy = self.root.tk = TclCallProxy(self.tkapp, self)
+        self.frame_id = self.root.after(self.frame_interval, self.end_frame)
+    
+    def uninstall(self):
+        if self.tkapp is None:
+            return
+        if self.frame_id is not None:
+            self.tkapp.call("after", "cancel", self.frame_id)
+            self.frame_id = None
+        self.proxy.enabled = False
+        self.root.tk = self.tkapp
+        self.tkapp = None
+        self.proxy = None
+    
+    def end_frame(self):
+        if self.frame_calls:
+            self.calls_per_frame.add(self.frame_calls)
+            self.time_per_frame.add(self.frame_time * 1000)
+        self.frame_calls = 0
+        self.frame_time = 0.0
+        if self.tkapp is not None:
+            self.frame_id = self.root.after(self.frame_interval, self.end_frame)
+    
+    def command_name(self, args):
+        if len(args) == 1 and isinstance(args[0], tuple):
+            args = args[0]
+        if not args:
+            return ""
+        first = str(args[0])
+        if first.startswith(".") and len(args) > 1:
+            return f"<widget> {args[1]}"
+        if first in self.SUBCOMMANDS and len(args) > 1 and not str(args[1]).isdigit():
+            return f"{first} {args[1]}"
+        return first
+    
+    def caller(self):
+        frame = sys._getframe(3)
+        while frame is not None and frame.f_globals.get("__name__", "").startswith("tkinter"):
+            frame = frame.f_back
+        if frame is None:
+            return ("<tcl>", "<unknown>")
+        code = frame.f_code
+        method = getattr(code, "co_qualname", code.co_name)
+        owner = frame.f_locals.get("self")
+        component = type(owner).__name__ if owner is not None else frame.f_globals.get("__name__", "?")
+        return (component, method)
+    
+    def profile_call(self, tkapp, args):
+        key = self.caller() + (self.command_name(args),)
+        self.depth += 1
+        self.child_time.append(0.0)
+        start = time.perf_counter()
+        try:
+            return tkapp.call(*args)
+        finally:
+            elapsed = time.perf_counter() - start
+            self_time = elapsed - self.child_time.pop()
+            self.depth -= 1
+            if self.child_time:
+                self.child_time[-1] += elapsed
+            
+            entry = self.calls.get(key)
+            if entry is None:
+                entry = self.calls[key] = [0, 0.0]
+            entry[0] += 1
+            entry[1] += self_time
+            self.frame_calls += 1
+            self.frame_time += self_time
+    
+    def top(self, limit=20):
+        rows = [
+            {
+                "component": component,
+                "method": method,
+                "command": command,
+                "calls": count,
+                "total_ms": total * 1000,
+                "mean_us": total / count * 1e6,
+            }
+            for (component, method, command), (count, total) in self.calls.items()
+        ]
+        rows.sort(key=lambda row: row["total_ms"], reverse=True)
+        return rows[:limit]
+    
+    def report(self, limit=20):
+        lines = [
+            f"Tcl calls per frame: {self.calls_per_frame.to_dict()}",
+            f"Tcl time per frame (ms): {self.time_per_frame.to_dict()}",
+            "",
+            f"{'calls':>8} {'total ms':>10} {'mean us':>9}  caller / command",
+        ]
+        for row in self.top(limit):
+            lines.append(
+                f"{row['calls']:>8} {row['total_ms']:>10.2f} {row['mean_us']:>9.1f}  "
+                f"{row['component']}: {row['method']} -> {row['command']}"
+            )
+        return "\n".join(lines)
+
+
+def stroke_shapes(points, width):
+    half = width / 2
+    shapes = [("+", "circle", x, y, half) for x, y in points]
+    for (x0, y0), (x1, y1) in zip(points, points[1:]):
+        length = math.hypot(x1 - x0, y1 - y0)
+        nx, ny = -(y1 - y0) / length * half, (x1 - x0) / length * half
+        shapes.append(("+", "poly", [(x0 + nx, y0 + ny), (x1 + nx, y1 + ny), (x1 - nx, y1 - ny), (x0 - nx, y0 - ny)]))
+    return shapes
+
+
+def gear_shapes(teeth, radius, tooth_length, tooth_width, hole):
+    shapes = [("+", "circle", 0.5, 0.5, radius)]
+    for k in range(teeth):
+        angle = 2 * math.pi * k / teeth
+        dx, dy = math.cos(angle), math.sin(angle)
+        tx, ty = -dy * tooth_width / 2, dx * tooth_width / 2
+        inner, outer = radius - 0.05, radius + tooth_length
+        shapes.append(("+", "poly", [
+            (0.5 + dx * inner + tx, 0.5 + dy * inner + ty),
+            (0.5 + dx * outer + tx, 0.5 + dy * outer + ty),
+            (0.5 + dx * outer - tx, 0.5 + dy * outer - ty),
+            (0.5 + dx * inner - tx, 0.5 + dy * inner - ty),
+        ]))
+    shapes.append(("-", "circle", 0.5, 0.5, hole))
+    return shapes
+
+
+def merge_spans(spans):
+    merged = []
+    for start, end in sorted(spans):
+        if merged and start <= merged[-1][1]:
+            merged[-1][1] = max(merged[-1][1], end)
+        else:
+            merged.append([start, end])
+    return merged
+
+
+class IconAtlas:
+    shapes = {
+        "🏠": [
+            ("+", "poly", [(0.5, 0.06), (0.96, 0.48), (0.04, 0.48)]),
+            ("+", "rect", 0.16, 0.44, 0.84, 0.92),
+            ("-", "rect", 0.41, 0.6, 0.59, 0.92),
+        ],
+        "📊": [
+            ("+", "rect", 0.1, 0.5, 0.3, 0.86),
+            ("+", "rect", 0.4, 0.24, 0.6, 0.86),
+            ("+", "rect", 0.7, 0.08, 0.9, 0.86),
+            ("+", "rect", 0.04, 0.86, 0.96, 0.94),
+        ],
+        "⚙": gear_shapes(8, 0.3, 0.16, 0.14, 0.12),
+        "ℹ": [
+            ("+", "circle", 0.5, 0.5, 0.46),
+            ("-", "circle", 0.5, 0.27, 0.075),
+            ("-", "rect", 0.43, 0.41, 0.57, 0.77),
+        ],
+        "🗂": [
+            ("+", "rect", 0.06, 0.14, 0.44, 0.3),
+            ("+", "rect", 0.06, 0.26, 0.94, 0.86),
+            ("-", "rect", 0.06, 0.38, 0.94, 0.43),
+        ],
+        "📈": stroke_shapes([(0.08, 0.82), (0.36, 0.52), (0.56, 0.68), (0.82, 0.34)], 0.11) + [
+            ("+", "poly", [(0.96, 0.14), (0.92, 0.48), (0.64, 0.24)]),
+        ],
+    }
+    runs = {}
+    
+    def __init__(self, master):
+        self.master = master
+        self.images = {}
+    
+    def get(self, glyph, size, color):
+        key = (glyph, size, color)
+        if key not in self.images:
+            runs = self.rasterize(glyph.replace("\ufe0f", ""), size)
+            image = None
+            if runs is not None:
+                image = tk.PhotoImage(master=self.master, width=size, height=size)
+                for run in runs:
+                    image.put(color, to=run)
+            self.images[key] = image
+        return self.images[key]
+    
+    def label_options(self, glyph, size, color):
+        image = self.get(glyph, size, color)
+        if image is None:
+            return {"text": glyph, "font": ("Arial", size * 3 // 4), "fg": color}
+        return {"image": image}
+    
+    def rasterize(self, glyph, size):
+        key = (glyph, size)
+        if key in self.runs:
+            return self.runs[key]
+        shapes = self.shapes.get(glyph)
+        runs = None
+        if shapes:
+            runs = []
+            for row in range(size):
+                y = (row + 0.5) / size
+                filled = merge_spans(span for shape in shapes if shape[0] == "+" for span in self.shape_spans(shape, y))
+                holes = merge_spans(span for shape in shapes if shape[0] == "-" for span in self.shape_spans(shape, y))
+                for start, end in filled:
+                    for hole_start, hole_end in holes:
+                        if hole_end <= start or hole_start >= end:
+                            continue
+                        if hole_start > start:
+                            self.add_run(runs, row, size, start, hole_start)
+                        start = max(start, hole_end)
+                    if end > start:
+                        self.add_run(runs, row, size, start, end)
+        self.runs[key] = runs
+        return runs
+    
+    def add_run(self, runs, row, size, start, end):
+        first = max(0, math.ceil(start * size - 0.5))
+        last = min(size, math.floor(end * size - 0.5) + 1)
+        if last > first:
+            runs.append((first, row, last, row + 1))
+    
+    def shape_spans(self, shape, y):
+        kind = shape[1]
+        if kind == "rect":
+            x0, y0, x1, y1 = shape[2:]
+            return [(x0, x1)] if y0 <= y <= y1 else []
+        if kind == "circle":
+            cx, cy, radius = shape[2:]
+            reach = radius * radius - (y - cy) ** 2
+            if reach <= 0:
+                return []
+            reach = math.sqrt(reach)
+            return [(cx - reach, cx + reach)]
+        points = shape[2]
+        crossings = sorted(
+            xa + (y - ya) * (xb - xa) / (yb - ya)
+            for (xa, ya), (xb, yb) in zip(points, points[1:] + points[:1])
+            if (ya <= y) != (yb <= y)
+        )
+        return list(zip(crossings[::2], crossings[1::2]))
 
 
 class SidebarMenuItem:
-    def __init__(self, parent, text, icon, command, animation_engine):
+    def __init__(self, parent, text, icon, command, animation_engine, icons=None):
         self.parent = parent
         self.text = text
         self.icon = icon
         self.command = command
         self.animation_engine = animation_engine
+        self.icons = icons or IconAtlas(parent)
         self.is_active = False
         self.is_hovered = False
         self.current_color = "#2c3e50"
@@ -52,11 +730,8 @@ class SidebarMenuItem:
         
         self.icon_label = tk.Label(
             self.frame,
-            text=self.icon,
-            font=("Arial", 16),
             bg=self.current_color,
-            fg="white",
-            width=3
+            **self.icons.label_options(self.icon, 22, "white")
         )
         self.icon_label.pack(side=tk.LEFT, padx=(10, 5), pady=10)
         
@@ -116,7 +791,7 @@ class SidebarMenuItem:
             self.icon_label.config(bg=color)
             self.text_label.config(bg=color)
         
-        self.animation_engine.animate(0.2, interpolate_color)
+        self.animation_engine.animate(0.2, interpolate_color, label="item-color")
     
     def get_current_bg(self):
         return self.frame.cget("bg")
@@ -136,10 +811,11 @@ class SidebarMenuItem:
 
 
 class Sidebar:
-    def __init__(self, parent, animation_engine, on_navigate):
+    def __init__(self, parent, animation_engine, on_navigate, icons=None):
         self.parent = parent
         self.animation_engine = animation_engine
         self.on_navigate = on_navigate
+        self.icons = icons or IconAtlas(parent)
         self.is_expanded = True
         self.expanded_width = 220
         self.collapsed_width = 60
@@ -185,7 +861,8 @@ class Sidebar:
             ("Home", "🏠", "home"),
             ("Dashboard", "📊", "dashboard"),
             ("Settings", "⚙️", "settings"),
-            ("About", "ℹ️", "about")
+            ("About", "ℹ️", "about"),
+            ("Data", "🗂️", "data")
         ]
         
         for text, icon, page in menu_data:
@@ -194,7 +871,8 @@ class Sidebar:
                 text,
                 icon,
                 lambda p=page: self.navigate_to(p),
-                self.animation_engine
+                self.animation_engine,
+                self.icons
             )
             self.menu_items.append(item)
         
@@ -234,7 +912,24 @@ class Sidebar:
         if self.is_expanded:
             on_complete()
         
-        self.animation_engine.animate(0.3, update_width, on_complete if not self.is_expanded else None)
+        self.animation_engine.animate(
+            0.3, update_width, on_complete if not self.is_expanded else None, label="sidebar-width"
+        )
+    
+    def set_expanded(self, expanded):
+        if expanded == self.is_expanded:
+            return
+        self.is_expanded = expanded
+        self.current_width = self.expanded_width if expanded else self.collapsed_width
+        self.frame.config(width=self.current_width)
+        if expanded:
+            self.title_label.pack(side=tk.LEFT, padx=10)
+            for item in self.menu_items:
+                item.show_text()
+        else:
+            for item in self.menu_items:
+                item.hide_text()
+            self.title_label.pack_forget()
 
 
 class BaseView:
@@ -243,7 +938,8 @@ class BaseView:
         self.animation_engine = animation_engine
         self.frame = tk.Frame(parent, bg="#ecf0f1")
         self.opacity = 0.0
-        self.setup_ui()
+        with startup_tracer.span(f"{type(self).__name__}.setup_ui"):
+            self.setup_ui()
     
     def setup_ui(self):
         pass
@@ -266,80 +962,401 @@ class BaseView:
             alpha = int(255 * progress)
             color = f'#{alpha:02x}{alpha:02x}{alpha:02x}'
         
-        self.animation_engine.animate(0.3, update_opacity)
+        self.animation_engine.animate(0.3, update_opacity, label="view-fade")
     
     def fade_out(self, callback=None):
         def update_opacity(progress):
             self.opacity = 1.0 - progress
         
-        self.animation_engine.animate(0.2, update_opacity, callback)
+        self.animation_engine.animate(0.2, update_opacity, callback, label="view-fade")
+
+
+class WidgetPool:
+    defaults = {
+        "Frame": {"bg": "white", "width": 0, "height": 0, "relief": "flat", "bd": 0},
+        "Label": {
+            "text": "",
+            "font": ("Arial", 12),
+            "bg": "white",
+            "fg": "#2c3e50",
+            "width": 0,
+            "anchor": "center",
+            "justify": "center",
+        },
+        "Button": {
+            "text": "",
+            "font": ("Arial", 12, "bold"),
+            "bg": "#3498db",
+            "fg": "white",
+            "padx": 20,
+            "pady": 10,
+            "cursor": "hand2",
+            "bd": 0,
+        },
+        "Checkbutton": {"bg": "white", "cursor": "hand2"},
+        "Entry": {"font": ("Arial", 11), "bg": "#ecf0f1", "relief": "flat", "bd": 5},
+    }
+    
+    def __init__(self, host):
+        self.host = host
+        self.free = {kind: [] for kind in self.defaults}
+        self.kinds = {}
+        self.configs = {}
+        self.commands = {}
+        self.created = 0
+    
+    def acquire(self, kind, container, pack=None, propagate=True, command=None, **options):
+        wanted = dict(self.defaults[kind], **options)
+        free = self.free[kind]
+        if free:
+            widget = free.pop()
+            config = self.configs[widget]
+            changed = {key: value for key, value in wanted.items() if config.get(key) != value}
+            if changed:
+                widget.configure(**changed)
+                config.update(changed)
+        else:
+            widget = getattr(tk, kind)(self.host, **wanted)
+            if kind == "Button":
+                widget.configure(command=lambda: self.run_command(widget))
+            config = self.configs[widget] = dict(wanted, propagate=True)
+            self.kinds[widget] = kind
+            self.created += 1
+        if config["propagate"] != propagate:
+            widget.pack_propagate(propagate)
+            config["propagate"] = propagate
+        self.commands[widget] = command
+        widget.pack(in_=container, **(pack or {}))
+        widget.lift()
+        return widget
+    
+    def release(self, widgets):
+        for widget in reversed(widgets):
+            widget.pack_forget()
+            self.commands.pop(widget, None)
+            self.free[self.kinds[widget]].append(widget)
+    
+    def run_command(self, widget):
+        command = self.commands.get(widget)
+        if command:
+            command()
+    
+    def size(self):
+        return len(self.kinds)
 
 
-class HomeView(BaseView):
+class SpecView(BaseView):
+    spec = {"title": "", "color": "#3498db", "inset": True, "items": []}
+    
+    def __init__(self, parent, animation_engine, pool=None, navigate=None):
+        self.pool = pool or WidgetPool(parent)
+        self.navigate = navigate
+        self.widgets = []
+        self.pending_focus = None
+        super().__init__(parent, animation_engine)
+    
     def setup_ui(self):
-        header = tk.Frame(self.frame, bg="#3498db", height=80)
-        header.pack(fill=tk.X)
-        header.pack_propagate(False)
-        
-        title = tk.Label(
+        self.variables = {}
+        self.settings = {}
+        for item in self.spec["items"]:
+            if item["kind"] == "toggle":
+                self.variables[item["label"]] = tk.BooleanVar(value=item["value"])
+                self.settings[item["label"]] = None
+            elif item["kind"] == "field":
+                name = item["label"].rstrip(":")
+                self.variables[name] = tk.StringVar(value=item["value"])
+                self.settings[name] = None
+    
+    def show(self):
+        self.materialize()
+        super().show()
+    
+    def complete_hide(self, callback):
+        self.frame.pack_forget()
+        self.release()
+        if callback:
+            callback()
+    
+    def focus_setting(self, name):
+        widget = self.settings.get(name)
+        if widget is None:
+            self.pending_focus = name
+        else:
+            widget.focus_set()
+    
+    def acquire(self, kind, container, pack=None, **options):
+        widget = self.pool.acquire(kind, container, pack, **options)
+        self.widgets.append(widget)
+        return widget
+    
+    def materialize(self):
+        if self.widgets:
+            return
+        spec = self.spec
+        header = self.acquire("Frame", self.frame, {"fill": tk.X}, bg=spec["color"], height=80, propagate=False)
+        self.acquire(
+            "Label",
             header,
-            text="🏠 Welcome Home",
+            {"pady": 20},
+            text=spec["title"],
             font=("Arial", 24, "bold"),
-            bg="#3498db",
+            bg=spec["color"],
             fg="white"
         )
-        title.pack(pady=20)
-        
-        content = tk.Frame(self.frame, bg="#ecf0f1")
-        content.pack(fill=tk.BOTH, expand=True, padx=40, pady=40)
-        
-        welcome_card = tk.Frame(content, bg="white", relief=tk.RAISED, bd=2)
-        welcome_card.pack(fill=tk.BOTH, expand=True)
-        
-        card_title = tk.Label(
-            welcome_card,
-            text="Welcome to the Complex GUI Application",
-            font=("Arial", 18, "bold"),
-            bg="white",
-            fg="#2c3e50"
-        )
-        card_title.pack(pady=(30, 10))
-        
-        description = tk.Label(
-            welcome_card,
-            text="This application demonstrates advanced tkinter features including:\n\n"
-                 "• Collapsible sidebar with smooth animations\n"
-                 "• Multiple page navigation\n"
-                 "• Fade transitions between views\n"
-                 "• Hover effects with color animations\n"
-                 "• Responsive layout design\n\n"
-                 "Use the sidebar menu to navigate between different pages.",
-            font=("Arial", 12),
-            bg="white",
-            fg="#34495e",
-            justify=tk.LEFT
-        )
-        description.pack(pady=20, padx=40)
-        
-        button_frame = tk.Frame(welcome_card, bg="white")
-        button_frame.pack(pady=30)
-        
-        explore_btn = tk.Button(
-            button_frame,
-            text="Explore Dashboard",
-            font=("Arial", 12, "bold"),
-            bg="#3498db",
-            fg="white",
-            padx=20,
-            pady=10,
-            cursor="hand2",
-            bd=0,
-            command=lambda: self.parent.master.navigate_to_page("dashboard")
-        )
-        explore_btn.pack()
+        content = self.acquire("Frame", self.frame, {"fill": tk.BOTH, "expand": True, "padx": 40, "pady": 40}, bg="#ecf0f1")
+        body = self.acquire("Frame", content, {"fill": tk.BOTH, "expand": True}, relief=tk.RAISED, bd=2)
+        if spec.get("inset", True):
+            body = self.acquire("Frame", body, {"fill": tk.BOTH, "expand": True, "padx": 40, "pady": 40})
+        for item in spec["items"]:
+            self.build_item(body, item)
+        
+        if self.pending_focus is not None:
+            self.settings[self.pending_focus].focus_set()
+            self.pending_focus = None
+    
+    def build_item(self, parent, item):
+        kind = item["kind"]
+        if kind == "label":
+            options = {key: value for key, value in item.items() if key not in ("kind", "pack")}
+            self.acquire("Label", parent, item.get("pack"), **options)
+        elif kind == "divider":
+            self.acquire("Frame", parent, {"fill": tk.X, "pady": 20}, bg="#ecf0f1", height=2)
+        elif kind == "toggle":
+            row = self.acquire("Frame", parent, {"fill": tk.X, "pady": 10})
+            self.acquire("Label", row, {"side": tk.LEFT}, text=item["label"])
+            self.settings[item["label"]] = self.acquire(
+                "Checkbutton",
+                row,
+                {"side": tk.RIGHT},
+                variable=self.variables[item["label"]]
+            )
+        elif kind == "field":
+            name = item["label"].rstrip(":")
+            row = self.acquire("Frame", parent, {"fill": tk.X, "pady": 10})
+            self.acquire(
+                "Label",
+                row,
+                {"side": tk.LEFT},
+                text=item["label"],
+                font=("Arial", 11),
+                fg="#7f8c8d",
+                width=15,
+                anchor="w"
+            )
+            self.settings[name] = self.acquire(
+                "Entry",
+                row,
+                {"side": tk.LEFT, "fill": tk.X, "expand": True},
+                textvariable=self.variables[name]
+            )
+        elif kind == "buttons":
+            row = self.acquire("Frame", parent, item.get("pack"))
+            for button in item["buttons"]:
+                options = {key: value for key, value in button.items() if key != "page"}
+                command = None
+                if button.get("page") and self.navigate:
+                    command = lambda page=button["page"]: self.navigate(page)
+                self.acquire("Button", row, {"side": tk.LEFT, "padx": 5}, command=command, **options)
+    
+    def release(self):
+        self.pool.release(self.widgets)
+        self.widgets = []
+        for name in self.settings:
+            self.settings[name] = None
+
+
+class HomeView(SpecView):
+    spec = {
+        "title": "🏠 Welcome Home",
+        "color": "#3498db",
+        "inset": False,
+        "items": [
+            {
+                "kind": "label",
+                "text": "Welcome to the Complex GUI Application",
+                "font": ("Arial", 18, "bold"),
+                "pack": {"pady": (30, 10)},
+            },
+            {
+                "kind": "label",
+                "text": "This application demonstrates advanced tkinter features including:\n\n"
+                        "• Collapsible sidebar with smooth animations\n"
+                        "• Multiple page navigation\n"
+                        "• Fade transitions between views\n"
+                        "• Hover effects with color animations\n"
+                        "• Responsive layout design\n\n"
+                        "Use the sidebar menu to navigate between different pages.",
+                "fg": "#34495e",
+                "justify": "left",
+                "pack": {"pady": 20, "padx": 40},
+            },
+            {
+                "kind": "buttons",
+                "buttons": [{"text": "Explore Dashboard", "page": "dashboard"}],
+                "pack": {"pady": 30},
+            },
+        ],
+    }
+
+
+class RingBuffer:
+    def __init__(self, capacity, typecode="d"):
+        self.capacity = capacity
+        self.data = array(typecode, [0]) * capacity
+        self.total = 0
+    
+    def __len__(self):
+        return min(self.total, self.capacity)
+    
+    def append(self, value):
+        self.data[self.total % self.capacity] = value
+        self.total += 1
+    
+    def extend(self, values):
+        values = array(self.data.typecode, values)
+        count = len(values)
+        if count > self.capacity:
+            self.total += count - self.capacity
+            values = values[-self.capacity:]
+            count = self.capacity
+        slot = self.total % self.capacity
+        first = min(count, self.capacity - slot)
+        self.data[slot:slot + first] = values[:first]
+        self.data[:count - first] = values[first:]
+        self.total += count
+    
+    def oldest(self):
+        return self.total - len(self)
+    
+    def window(self, start, stop):
+        start = max(start, self.oldest())
+        stop = min(stop, self.total)
+        if start >= stop:
+            return array(self.data.typecode)
+        first = start % self.capacity
+        last = (stop - 1) % self.capacity + 1
+        if first < last:
+            return self.data[first:last]
+        return self.data[first:] + self.data[:last]
+    
+    def values(self):
+        return self.window(self.oldest(), self.total)
+
+
+class StreamingChart:
+    def __init__(self, canvas, buffer, samples_per_column=16, column_width=2, max_value=100.0,
+                 frame_interval=1 / 60):
+        self.canvas = canvas
+        self.buffer = buffer
+        self.samples_per_column = samples_per_column
+        self.column_width = column_width
+        self.max_value = max_value
+        self.frame_ms = max(1, int(frame_interval * 1000))
+        self.margin = 40
+        self.columns = deque()
+        self.next_column = 0
+        self.render_pending = False
+        self.active = True
+        self.size = None
+        self.redraw()
+    
+    def append(self, value):
+        self.buffer.append(value)
+        self.schedule_render()
+    
+    def extend(self, values):
+        self.buffer.extend(values)
+        self.schedule_render()
+    
+    def schedule_render(self):
+        if not self.render_pending and self.active:
+            self.render_pending = True
+            self.canvas.after(self.frame_ms, self.render)
+    
+    def stop(self):
+        self.active = False
+        self.canvas.delete("stream")
+        self.columns.clear()
+    
+    def measure(self):
+        width = self.canvas.winfo_width()
+        height = self.canvas.winfo_height()
+        return (width if width > 1 else 600, height if height > 1 else 300)
+    
+    def on_resize(self, event=None):
+        if self.active and self.measure() != self.size:
+            self.redraw()
+    
+    def redraw(self):
+        canvas = self.canvas
+        canvas.delete("all")
+        self.columns.clear()
+        self.size = width, height = self.measure()
+        margin = self.margin
+        self.max_columns = max(1, int((width - 2 * margin) // self.column_width))
+        self.baseline = height - margin
+        self.chart_height = height - 2 * margin
+        canvas.create_line(margin, self.baseline, width - margin, self.baseline, fill="#bdc3c7", width=2)
+        canvas.create_line(margin, margin, margin, self.baseline, fill="#bdc3c7", width=2)
+        
+        complete = self.buffer.total // self.samples_per_column
+        oldest = -(-self.buffer.oldest() // self.samples_per_column)
+        self.next_column = max(oldest, complete - self.max_columns)
+        self.draw_columns(complete)
+    
+    def render(self):
+        self.render_pending = False
+        if not self.active:
+            return
+        complete = self.buffer.total // self.samples_per_column
+        count = complete - self.next_column
+        if count <= 0:
+            return
+        if count >= self.max_columns or self.next_column * self.samples_per_column < self.buffer.oldest():
+            self.redraw()
+            return
+        self.canvas.move("stream", -count * self.column_width, 0)
+        overflow = len(self.columns) + count - self.max_columns
+        if overflow > 0:
+            self.canvas.delete(*[self.columns.popleft() for i in range(overflow)])
+        self.draw_columns(complete)
+    
+    def draw_columns(self, complete):
+        spc = self.samples_per_column
+        start = self.next_column
+        if start >= complete:
+            return
+        samples = self.buffer.window(start * spc, complete * spc)
+        peaks = [max(samples[i:i + spc]) for i in range(0, len(samples), spc)]
+        top = max(peaks)
+        if top > self.max_value:
+            self.max_value = top * 1.25
+            self.redraw()
+            return
+        canvas = self.canvas
+        right = self.size[0] - self.margin
+        scale = self.chart_height / self.max_value
+        x = right - (complete - start) * self.column_width
+        for peak in peaks:
+            self.columns.append(canvas.create_rectangle(
+                x, self.baseline - peak * scale,
+                x + self.column_width, self.baseline,
+                fill="#3498db",
+                outline="",
+                tags="stream"
+            ))
+            x += self.column_width
+        self.next_column = complete
 
 
 class DashboardView(BaseView):
+    default_chart_data = [30, 50, 40, 70, 60, 80, 75, 90, 85, 95]
+    default_chart_size = (600, 300)
+    
+    def __init__(self, parent, animation_engine, icons=None):
+        self.icons = icons or IconAtlas(parent)
+        super().__init__(parent, animation_engine)
+    
     def setup_ui(self):
         header = tk.Frame(self.frame, bg="#2ecc71", height=80)
         header.pack(fill=tk.X)
@@ -360,6 +1377,8 @@ class DashboardView(BaseView):
         stats_frame = tk.Frame(content, bg="#ecf0f1")
         stats_frame.pack(fill=tk.X, pady=(0, 20))
         
+        self.stats = {}
+        self.stat_labels = {}
         self.create_stat_card(stats_frame, "Total Users", "1,234", "#3498db", 0)
         self.create_stat_card(stats_frame, "Active Sessions", "89", "#2ecc71", 1)
         self.create_stat_card(stats_frame, "Revenue", "$12.5K", "#f39c12", 2)
@@ -378,6 +1397,27 @@ class DashboardView(BaseView):
         
         canvas = tk.Canvas(chart_frame, bg="white", height=300, highlightthickness=0)
         canvas.pack(fill=tk.BOTH, expand=True, padx=30, pady=(10, 30))
+        self.chart_canvas = canvas
+        self.stream = None
+        self.chart_data = list(self.default_chart_data)
+        self.series_cache = None
+        self.compute_aggregates()
+        
+        self.chart_size = None
+        self.fallback_size = self.default_chart_size
+        self.bar_lefts = []
+        self.bar_rights = []
+        self.bar_items = []
+        self.tooltip = None
+        self.hover_point = None
+        self.hover_pending = False
+        self.hovered_bar = None
+        self.selected_bar = None
+        self.hover_ms = max(1, int(self.animation_engine.frame_interval * 1000))
+        canvas.bind("<Motion>", self.on_chart_motion)
+        canvas.bind("<Leave>", self.on_chart_leave)
+        canvas.bind("<Button-1>", self.on_chart_click)
+        canvas.bind("<Configure>", self.on_chart_resize)
         
         self.draw_simple_chart(canvas)
     
@@ -390,7 +1430,7 @@ class DashboardView(BaseView):
         icon_frame.pack(pady=(20, 10))
         icon_frame.pack_propagate(False)
         
-        icon_label = tk.Label(icon_frame, text="📈", font=("Arial", 24), bg=color)
+        icon_label = tk.Label(icon_frame, bg=color, **self.icons.label_options("📈", 32, "white"))
         icon_label.pack(expand=True)
         
         value_label = tk.Label(
@@ -401,6 +1441,8 @@ class DashboardView(BaseView):
             fg="#2c3e50"
         )
         value_label.pack()
+        self.stats[title] = value
+        self.stat_labels[title] = value_label
         
         title_label = tk.Label(
             card,
@@ -411,26 +1453,199 @@ class DashboardView(BaseView):
         )
         title_label.pack(pady=(5, 20))
     
+    def compute_aggregates(self):
+        data = self.chart_data
+        self.aggregates = {
+            "count": len(data),
+            "min": min(data, default=0),
+            "max": max(data, default=0),
+            "mean": sum(data) / len(data) if data else 0,
+        }
+    
+    def chart_series(self, buckets):
+        if self.series_cache is None or self.series_cache[0] != buckets:
+            self.series_cache = (buckets, decimate_max(self.chart_data, buckets))
+        return self.series_cache[1]
+    
+    def redraw_chart(self, data=None):
+        if data is not None:
+            self.chart_data = data
+            self.series_cache = None
+            self.compute_aggregates()
+        if self.stream is not None:
+            return
+        self.chart_canvas.delete("all")
+        self.draw_simple_chart(self.chart_canvas)
+    
+    def start_stream(self, capacity=16384, samples_per_column=16, max_value=100.0):
+        if self.stream is None:
+            self.on_chart_leave()
+            self.stream = StreamingChart(
+                self.chart_canvas,
+                RingBuffer(capacity),
+                samples_per_column,
+                max_value=max_value,
+                frame_interval=self.animation_engine.frame_interval
+            )
+        return self.stream
+    
+    def stop_stream(self):
+        if self.stream is not None:
+            self.stream.stop()
+            self.stream = None
+            self.redraw_chart()
+    
+    def on_chart_resize(self, event=None):
+        if self.stream is not None:
+            self.stream.on_resize()
+            return
+        width = self.chart_canvas.winfo_width()
+        height = self.chart_canvas.winfo_height()
+        fallback_width, fallback_height = self.fallback_size
+        if (width if width > 1 else fallback_width, height if height > 1 else fallback_height) != self.chart_size:
+            self.redraw_chart()
+    
+    def bar_at(self, x, y):
+        index = bisect.bisect_right(self.bar_lefts, x) - 1
+        if index < 0 or x > self.bar_rights[index] or not self.chart_top <= y <= self.chart_baseline:
+            return None
+        return index
+    
+    def bar_label(self, index):
+        series = self.series_cache[1]
+        count = len(self.chart_data)
+        if count <= len(series):
+            return f"#{index + 1}: {series[index]:,}"
+        first = index * count // len(series)
+        last = (index + 1) * count // len(series)
+        return f"#{first + 1:,}–{last:,}: max {series[index]:,}"
+    
+    def on_chart_motion(self, event):
+        self.hover_point = (event.x, event.y)
+        if not self.hover_pending:
+            self.hover_pending = True
+            self.chart_canvas.after(self.hover_ms, self.update_hover)
+    
+    def on_chart_leave(self, event=None):
+        self.hover_point = None
+        self.show_tooltip(None)
+    
+    def update_hover(self):
+        self.hover_pending = False
+        if self.hover_point is None or self.stream is not None:
+            return
+        self.show_tooltip(self.bar_at(*self.hover_point))
+    
+    def show_tooltip(self, index):
+        if index == self.hovered_bar:
+            return
+        self.hovered_bar = index
+        canvas = self.chart_canvas
+        if index is None:
+            if self.tooltip is not None:
+                canvas.itemconfig(self.tooltip, state="hidden")
+            return
+        if self.tooltip is None:
+            self.tooltip = canvas.create_text(
+                0, 0,
+                anchor="s",
+                font=("Arial", 10, "bold"),
+                fill="#2c3e50",
+                tags="tooltip"
+            )
+        canvas.itemconfig(self.tooltip, text=self.bar_label(index), state="normal")
+        canvas.coords(self.tooltip, (self.bar_lefts[index] + self.bar_rights[index]) / 2, self.bar_tops[index] - 6)
+    
+    def on_chart_click(self, event):
+        if self.stream is None:
+            self.select_bar(self.bar_at(event.x, event.y))
+    
+    def select_bar(self, index):
+        if self.selected_bar is not None:
+            self.chart_canvas.itemconfig(self.bar_items[self.selected_bar], fill="#3498db")
+        self.selected_bar = index
+        if index is not None:
+            self.chart_canvas.itemconfig(self.bar_items[index], fill="#e67e22")
+    
+    def set_stat(self, title, value):
+        self.stats[title] = value
+        self.stat_labels[title].config(text=value)
+    
+    def snapshot(self):
+        return {
+            "data": list(self.chart_data),
+            "stats": dict(self.stats),
+            "aggregates": dict(self.aggregates),
+            "series": list(self.series_cache) if self.series_cache else None,
+            "chart_size": list(self.chart_size) if self.chart_size else None,
+        }
+    
+    def restore(self, state):
+        data = list(state["data"])
+        aggregates = {key: state["aggregates"][key] for key in ("count", "min", "max", "mean")}
+        series = tuple(state["series"]) if state.get("series") else None
+        stats = dict(state["stats"])
+        size = tuple(int(value) for value in state.get("chart_size") or self.default_chart_size)
+        if len(array("d", data)) != aggregates["count"]:
+            raise ValueError(f"Snapshot has {len(data)} data points but aggregates for {aggregates['count']}")
+        if series is not None and len(series) != 2:
+            raise ValueError(f"Expected a (buckets, values) series, got {len(series)} items")
+        if len(size) != 2:
+            raise ValueError(f"Expected a (width, height) chart size, got {len(size)} items")
+        self.chart_data = data
+        self.aggregates = aggregates
+        self.series_cache = series
+        self.fallback_size = size
+        self.redraw_chart()
+        for title, value in stats.items():
+            if title in self.stat_labels:
+                self.set_stat(title, value)
+    
+    def reset(self):
+        self.fallback_size = self.default_chart_size
+        self.redraw_chart(list(self.default_chart_data))
+    
+    def refresh(self):
+        aggregates, series = self.aggregates, self.series_cache
+        self.compute_aggregates()
+        self.series_cache = None
+        if series is not None:
+            self.chart_series(series[0])
+        if self.aggregates != aggregates or self.series_cache != series:
+            self.redraw_chart()
+    
     def draw_simple_chart(self, canvas):
-        canvas.update_idletasks()
+        with startup_tracer.span("draw_simple_chart.update_idletasks"):
+            canvas.update_idletasks()
         width = canvas.winfo_width()
         height = canvas.winfo_height()
         
         if width <= 1:
-            width = 600
+            width = self.fallback_size[0]
         if height <= 1:
-            height = 300
-        
-        data = [30, 50, 40, 70, 60, 80, 75, 90, 85, 95]
+            height = self.fallback_size[1]
         
         margin = 40
         chart_width = width - 2 * margin
         chart_height = height - 2 * margin
+        self.chart_size = (width, height)
+        self.chart_top = margin
+        self.chart_baseline = height - margin
+        self.bar_lefts = []
+        self.bar_rights = []
+        self.bar_tops = []
+        self.bar_items = []
+        self.tooltip = None
+        self.hovered_bar = None
+        self.selected_bar = None
+        data = self.chart_series(max(1, int(chart_width // 6)))
+        if not data:
+            return
         
         canvas.create_line(margin, height - margin, width - margin, height - margin, fill="#bdc3c7", width=2)
         canvas.create_line(margin, margin, margin, height - margin, fill="#bdc3c7", width=2)
         
-        max_value = max(data)
+        max_value = self.aggregates["max"] or 1
         bar_width = chart_width / len(data) * 0.7
         spacing = chart_width / len(data)
         
@@ -439,26 +1654,336 @@ class DashboardView(BaseView):
             bar_height = (value / max_value) * chart_height
             y = height - margin - bar_height
             
-            canvas.create_rectangle(
+            self.bar_items.append(canvas.create_rectangle(
                 x - bar_width / 2, y,
                 x + bar_width / 2, height - margin,
                 fill="#3498db",
                 outline="#2980b9",
                 width=2
-            )
+            ))
+            self.bar_lefts.append(x - spacing / 2)
+            self.bar_rights.append(x + spacing / 2)
+            self.bar_tops.append(y)
+
+
+class SettingsView(SpecView):
+    spec = {
+        "title": "⚙️ Settings",
+        "color": "#9b59b6",
+        "items": [
+            {"kind": "toggle", "label": "Enable Notifications", "value": True},
+            {"kind": "toggle", "label": "Dark Mode", "value": False},
+            {"kind": "toggle", "label": "Auto-Save", "value": True},
+            {"kind": "toggle", "label": "Sound Effects", "value": False},
+            {"kind": "divider"},
+            {
+                "kind": "label",
+                "text": "Profile Settings",
+                "font": ("Arial", 14, "bold"),
+                "pack": {"anchor": "w", "pady": (10, 20)},
+            },
+            {"kind": "field", "label": "Username:", "value": "john_doe"},
+            {"kind": "field", "label": "Email:", "value": "john@example.com"},
+            {
+                "kind": "buttons",
+                "buttons": [
+                    {"text": "Save Changes", "bg": "#2ecc71"},
+                    {"text": "Reset", "bg": "#95a5a6", "font": ("Arial", 12)},
+                ],
+                "pack": {"pady": (30, 0)},
+            },
+        ],
+    }
+
+
+class AboutView(SpecView):
+    spec = {
+        "title": "ℹ️ About",
+        "color": "#e74c3c",
+        "items": [
+            {
+                "kind": "label",
+                "text": "Complex GUI Application",
+                "font": ("Arial", 20, "bold"),
+                "pack": {"pady": (0, 10)},
+            },
+            {
+                "kind": "label",
+                "text": "Version 1.0.0",
+                "font": ("Arial", 11),
+                "fg": "#7f8c8d",
+                "pack": {"pady": (0, 30)},
+            },
+            {
+                "kind": "label",
+                "text": "This is a demonstration of advanced tkinter GUI development\n"
+                        "featuring smooth animations, responsive design, and modern UI patterns.\n\n"
+                        "Built with Python and tkinter, this application showcases:\n\n"
+                        "• Custom animation engine with easing functions\n"
+                        "• Collapsible sidebar navigation\n"
+                        "• Multiple view management\n"
+                        "• Smooth transitions and hover effects\n"
+                        "• Responsive layout that adapts to window resizing\n"
+                        "• Clean, modern design principles\n\n"
+                        "Technologies Used:\n"
+                        "• Python 3.x\n"
+                        "• tkinter (standard library)\n"
+                        "• Custom animation framework\n\n",
+                "font": ("Arial", 11),
+                "fg": "#34495e",
+                "justify": "left",
+                "pack": {"pady": 20},
+            },
+            {
+                "kind": "label",
+                "text": "© 2024 Complex GUI Application. All rights reserved.",
+                "font": ("Arial", 9),
+                "fg": "#95a5a6",
+                "pack": {"side": "bottom", "pady": (20, 0)},
+            },
+        ],
+    }
+
+
+class ColumnStore:
+    TYPECODES = {"int": "q", "float": "d"}
+    
+    def __init__(self):
+        self.columns = {}
+        self.kinds = {}
+        self.row_count = 0
+        self.sort_indexes = {}
+        self.rank_indexes = {}
+        self.lowered = {}
+    
+    def __len__(self):
+        return self.row_count
+    
+    def add_column(self, name, kind, values):
+        typecode = self.TYPECODES.get(kind)
+        column = array(typecode, values) if typecode else list(values)
+        if self.columns and len(column) != self.row_count:
+            raise ValueError(f"Column {name} has {len(column)} rows, expected {self.row_count}")
+        self.columns[name] = column
+        self.kinds[name] = kind
+        self.row_count = len(column)
+    
+    @classmethod
+    def sample(cls, row_count, seed=7):
+        store = cls()
+        for loaded in store.fill_sample(row_count, seed):
+            pass
+        return store
+    
+    def fill_sample(self, row_count, seed=7, chunk_size=25000):
+        rng = random.Random(seed)
+        first_names = ["Ada", "Alan", "Grace", "Linus", "Guido", "Barbara", "Ken", "Margaret", "Dennis", "Frances"]
+        regions = ["North", "South", "East", "West", "Central"]
+        for name, kind in [("id", "int"), ("name", "str"), ("region", "str"), ("value", "float"), ("sessions", "int")]:
+            self.add_column(name, kind, [])
+        columns = self.columns
+        lowered = self.lowered["name"] = []
+        for start in range(0, row_count, chunk_size):
+            count = min(chunk_size, row_count - start)
+            names = [
+                f"{first} {number:05d}"
+                for first, number in zip(rng.choices(first_names, k=count), rng.choices(range(100000), k=count))
+            ]
+            columns["id"].extend(range(start, start + count))
+            columns["name"].extend(names)
+            lowered.extend(map(str.lower, names))
+            columns["region"].extend(rng.choices(regions, k=count))
+            columns["value"].extend(rng.random() * 10000 for i in range(count))
+            columns["sessions"].extend(rng.choices(range(1000), k=count))
+            self.row_count = start + count
+            yield self.row_count
+    
+    def value(self, column, row):
+        return self.columns[column][row]
+    
+    def sort_index(self, column):
+        index = self.sort_indexes.get(column)
+        if index is None:
+            values = self.columns[column]
+            index = self.sort_indexes[column] = array("l", sorted(range(self.row_count), key=values.__getitem__))
+        return index
+    
+    def rank_index(self, column):
+        rank = self.rank_indexes.get(column)
+        if rank is None:
+            rank = array("l", bytes(self.row_count * array("l").itemsize))
+            for position, row in enumerate(self.sort_index(column)):
+                rank[row] = position
+            self.rank_indexes[column] = rank
+        return rank
+    
+    def lowered_column(self, column):
+        values = self.lowered.get(column)
+        if values is None:
+            values = self.lowered[column] = [str(value).lower() for value in self.columns[column]]
+        return values
 
 
-class SettingsView(BaseView):
+class IncrementalFilter:
+    CHUNK_SIZE = 100000
+    
+    def __init__(self, store, column):
+        self.store = store
+        self.column = column
+        self.query = ""
+        self.cache = {}
+        self.candidates = None
+        self.position = 0
+        self.matches = None
+        self.done = True
+    
+    def set_query(self, query):
+        query = query.lower()
+        if query == self.query:
+            return
+        self.query = query
+        self.cache = {key: value for key, value in self.cache.items() if query.startswith(key)}
+        
+        if not query or query in self.cache:
+            self.done = True
+            return
+        
+        base = max(self.cache, key=len, default=None)
+        self.candidates = self.cache[base] if base is not None else None
+        self.position = 0
+        self.matches = array("l")
+        self.done = False
+    
+    def step(self):
+        if self.done:
+            return True
+        
+        values = self.store.lowered_column(self.column)
+        query = self.query
+        total = len(self.candidates) if self.candidates is not None else len(self.store)
+        end = min(self.position + self.CHUNK_SIZE, total)
+        
+        if self.candidates is None:
+            self.matches.extend(row for row in range(self.position, end) if query in values[row])
+        else:
+            self.matches.extend(row for row in self.candidates[self.position:end] if query in values[row])
+        
+        self.position = end
+        if end >= total:
+            self.cache[query] = self.matches
+            self.candidates = None
+            self.done = True
+        return self.done
+    
+    def result(self):
+        if not self.query:
+            return None
+        return self.cache.get(self.query)
+
+
+class IndexBuilder:
+    CHUNK_SIZE = 50000
+    
+    def __init__(self, store, columns):
+        self.store = store
+        self.pending = [column for column in columns if column not in store.rank_indexes]
+        self.steps = None
+    
+    def is_ready(self, column):
+        return column in self.store.rank_indexes
+    
+    def prioritize(self, column):
+        if column in self.pending:
+            self.pending.remove(column)
+            self.pending.insert(0, column)
+    
+    def step(self):
+        if self.steps is None:
+            if not self.pending:
+                return True
+            self.steps = self.build(self.pending.pop(0))
+        if next(self.steps, None) is None:
+            self.steps = None
+        return self.steps is None and not self.pending
+    
+    def build(self, column):
+        key = self.store.columns[column].__getitem__
+        row_count = len(self.store)
+        chunk = self.CHUNK_SIZE
+        
+        runs = []
+        for start in range(0, row_count, chunk):
+            runs.append(array("l", sorted(range(start, min(start + chunk, row_count)), key=key)))
+            yield column
+        
+        while len(runs) > 1:
+            merged = []
+            for first, second in zip(runs[::2], runs[1::2]):
+                run = array("l")
+                i = j = 0
+                while i < len(first):
+                    i_end = min(i + chunk, len(first))
+                    j_end = bisect.bisect_left(second, key(first[i_end - 1]), j, key=key)
+                    if j_end - j > chunk:
+                        j_end = j + chunk
+                        i_end = bisect.bisect_right(first, key(second[j_end - 1]), i, i_end, key=key)
+                    run.extend(sorted(first[i:i_end] + second[j:j_end], key=key))
+                    i, j = i_end, j_end
+                    yield column
+                run.extend(second[j:])
+                merged.append(run)
+            if len(runs) % 2:
+                merged.append(runs[-1])
+            runs = merged
+        
+        index = runs[0] if runs else array("l")
+        rank = array("l", bytes(row_count * index.itemsize))
+        for start in range(0, row_count, chunk):
+            for position in range(start, min(start + chunk, row_count)):
+                rank[index[position]] = position
+            yield column
+        self.store.sort_indexes[column] = index
+        self.store.rank_indexes[column] = rank
+
+
+class DataGridView(BaseView):
+    row_count = 1000000
+    row_height = 24
+    header_height = 28
+    grid_columns = [
+        ("id", "ID", 90),
+        ("name", "Name", 200),
+        ("region", "Region", 120),
+        ("value", "Value", 120),
+        ("sessions", "Sessions", 100),
+    ]
+    
     def setup_ui(self):
-        header = tk.Frame(self.frame, bg="#9b59b6", height=80)
+        self.store = None
+        self.loader = None
+        self.filter = None
+        self.indexer = None
+        self.order = None
+        self.sort_column = None
+        self.sort_descending = False
+        self.pending_sort = None
+        self.first_row = 0
+        self.visible_rows = 0
+        self.canvas_width = 0
+        self.cell_items = []
+        self.cell_text = {}
+        self.render_pending = False
+        self.filter_pending = False
+        
+        header = tk.Frame(self.frame, bg="#1abc9c", height=80)
         header.pack(fill=tk.X)
         header.pack_propagate(False)
         
         title = tk.Label(
             header,
-            text="⚙️ Settings",
+            text="🗂️ Data Grid",
             font=("Arial", 24, "bold"),
-            bg="#9b59b6",
+            bg="#1abc9c",
             fg="white"
         )
         title.pack(pady=20)
@@ -466,213 +1991,754 @@ class SettingsView(BaseView):
         content = tk.Frame(self.frame, bg="#ecf0f1")
         content.pack(fill=tk.BOTH, expand=True, padx=40, pady=40)
         
-        settings_card = tk.Frame(content, bg="white", relief=tk.RAISED, bd=2)
-        settings_card.pack(fill=tk.BOTH, expand=True)
+        grid_card = tk.Frame(content, bg="white", relief=tk.RAISED, bd=2)
+        grid_card.pack(fill=tk.BOTH, expand=True)
         
-        settings_content = tk.Frame(settings_card, bg="white")
-        settings_content.pack(fill=tk.BOTH, expand=True, padx=40, pady=40)
+        toolbar = tk.Frame(grid_card, bg="white")
+        toolbar.pack(fill=tk.X, padx=20, pady=(20, 10))
         
-        self.create_setting_item(settings_content, "Enable Notifications", True, 0)
-        self.create_setting_item(settings_content, "Dark Mode", False, 1)
-        self.create_setting_item(settings_content, "Auto-Save", True, 2)
-        self.create_setting_item(settings_content, "Sound Effects", False, 3)
+        filter_label = tk.Label(
+            toolbar,
+            text="Filter by name:",
+            font=("Arial", 11),
+            bg="white",
+            fg="#7f8c8d"
+        )
+        filter_label.pack(side=tk.LEFT)
         
-        divider = tk.Frame(settings_content, bg="#ecf0f1", height=2)
-        divider.pack(fill=tk.X, pady=20)
+        self.filter_entry = tk.Entry(
+            toolbar,
+            font=("Arial", 11),
+            bg="#ecf0f1",
+            relief=tk.FLAT,
+            bd=5
+        )
+        self.filter_entry.pack(side=tk.LEFT, padx=10)
+        self.filter_entry.bind("<KeyRelease>", self.on_filter_changed)
         
-        profile_label = tk.Label(
-            settings_content,
-            text="Profile Settings",
-            font=("Arial", 14, "bold"),
+        self.status_label = tk.Label(
+            toolbar,
+            text="",
+            font=("Arial", 11),
             bg="white",
-            fg="#2c3e50"
+            fg="#7f8c8d"
         )
-        profile_label.pack(anchor="w", pady=(10, 20))
+        self.status_label.pack(side=tk.RIGHT)
         
-        self.create_input_field(settings_content, "Username:", "john_doe")
-        self.create_input_field(settings_content, "Email:", "john@example.com")
+        grid_frame = tk.Frame(grid_card, bg="white")
+        grid_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=(0, 20))
         
-        button_frame = tk.Frame(settings_content, bg="white")
-        button_frame.pack(pady=(30, 0))
+        self.scrollbar = tk.Scrollbar(grid_frame, orient=tk.VERTICAL, command=self.on_scrollbar)
+        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         
-        save_btn = tk.Button(
-            button_frame,
-            text="Save Changes",
-            font=("Arial", 12, "bold"),
-            bg="#2ecc71",
-            fg="white",
-            padx=20,
-            pady=10,
-            cursor="hand2",
-            bd=0
-        )
-        save_btn.pack(side=tk.LEFT, padx=5)
-        
-        reset_btn = tk.Button(
-            button_frame,
-            text="Reset",
-            font=("Arial", 12),
-            bg="#95a5a6",
-            fg="white",
-            padx=20,
-            pady=10,
-            cursor="hand2",
-            bd=0
-        )
-        reset_btn.pack(side=tk.LEFT, padx=5)
+        self.canvas = tk.Canvas(grid_frame, bg="white", highlightthickness=0)
+        self.canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        self.canvas.bind("<Configure>", self.on_canvas_resize)
+        self.canvas.bind("<Button-1>", self.on_canvas_click)
+        self.canvas.bind("<MouseWheel>", self.on_mouse_wheel)
+        self.canvas.bind("<Button-4>", lambda event: self.scroll_by(-3))
+        self.canvas.bind("<Button-5>", lambda event: self.scroll_by(3))
+    
+    def show(self):
+        super().show()
+        if self.loader is None:
+            self.status_label.config(text=f"Loading {self.row_count:,} rows...")
+            store = ColumnStore()
+            self.loader = store.fill_sample(self.row_count)
+            self.frame.after(350, self.load_data, store)
+    
+    def load_data(self, store):
+        loaded = next(self.loader, None)
+        if loaded is not None:
+            self.status_label.config(text=f"Loading {loaded:,} of {self.row_count:,} rows...")
+            self.frame.after(1, self.load_data, store)
+            return
+        self.store = store
+        self.filter = IncrementalFilter(store, "name")
+        self.indexer = IndexBuilder(store, [name for name, label, width in self.grid_columns])
+        self.frame.after(1, self.run_indexer)
+        self.update_order()
+        self.build_rows()
+    
+    def displayed_count(self):
+        return len(self.order) if self.order is not None else len(self.store)
+    
+    def displayed_row(self, position):
+        if self.sort_descending:
+            position = self.displayed_count() - 1 - position
+        return self.order[position] if self.order is not None else position
+    
+    def update_order(self):
+        matches = self.filter.result()
+        if self.sort_column is None:
+            self.order = matches
+        elif matches is None:
+            self.order = self.store.sort_index(self.sort_column)
+        elif len(matches) < len(self.store) // 8:
+            rank = self.store.rank_index(self.sort_column)
+            self.order = array("l", sorted(matches, key=rank.__getitem__))
+        else:
+            mask = bytearray(len(self.store))
+            for row in matches:
+                mask[row] = 1
+            sort_index = self.store.sort_index(self.sort_column)
+            self.order = array("l", compress(sort_index, map(mask.__getitem__, sort_index)))
+        
+        shown = self.displayed_count()
+        if self.pending_sort:
+            self.status_label.config(text="Sorting...")
+        elif self.filter.query:
+            self.status_label.config(text=f"{shown:,} of {len(self.store):,} rows")
+        else:
+            self.status_label.config(text=f"{shown:,} rows")
+        self.first_row = 0
     
-    def create_setting_item(self, parent, text, default_value, row):
-        item_frame = tk.Frame(parent, bg="white")
-        item_frame.pack(fill=tk.X, pady=10)
+    def on_canvas_resize(self, event):
+        visible_rows = max(1, (event.height - self.header_height) // self.row_height + 1)
+        if visible_rows != self.visible_rows or event.width != self.canvas_width:
+            self.visible_rows = visible_rows
+            self.canvas_width = event.width
+            self.build_rows()
+    
+    def build_rows(self):
+        self.canvas.delete("all")
+        self.cell_items = []
+        self.cell_text = {}
+        if self.visible_rows == 0:
+            self.visible_rows = max(1, (self.canvas.winfo_height() - self.header_height) // self.row_height + 1)
+        
+        x = 0
+        for name, label, width in self.grid_columns:
+            self.canvas.create_rectangle(x, 0, x + width, self.header_height, fill="#ecf0f1", outline="#bdc3c7",
+                                         tags=("header",))
+            self.canvas.create_text(x + 8, self.header_height / 2, text=label, anchor="w",
+                                    font=("Arial", 10, "bold"), fill="#2c3e50", tags=("header", "header-" + name))
+            x += width
+        
+        for row in range(self.visible_rows):
+            y = self.header_height + row * self.row_height
+            self.canvas.create_rectangle(0, y, x, y + self.row_height, outline="",
+                                         fill="#f8f9f9" if row % 2 else "white")
+            items = []
+            column_x = 0
+            for name, label, width in self.grid_columns:
+                items.append(self.canvas.create_text(column_x + 8, y + self.row_height / 2, text="", anchor="w",
+                                                     font=("Arial", 10), fill="#34495e"))
+                column_x += width
+            self.cell_items.append(items)
+        
+        self.update_header_labels()
+        self.render()
+    
+    def update_header_labels(self):
+        sort_column, descending = self.pending_sort or (self.sort_column, self.sort_descending)
+        for name, label, width in self.grid_columns:
+            if name == sort_column:
+                label += " ▼" if descending else " ▲"
+            self.canvas.itemconfig("header-" + name, text=label)
+    
+    def format_cell(self, column, value):
+        kind = self.store.kinds[column]
+        if kind == "float":
+            return f"{value:,.2f}"
+        if kind == "int" and column != "id":
+            return f"{value:,}"
+        return str(value)
+    
+    def schedule_render(self):
+        if not self.render_pending:
+            self.render_pending = True
+            self.frame.after_idle(self.render)
+    
+    def render(self):
+        self.render_pending = False
+        if self.store is None:
+            return
         
-        label = tk.Label(
-            item_frame,
-            text=text,
-            font=("Arial", 12),
-            bg="white",
-            fg="#2c3e50"
+        count = self.displayed_count()
+        for offset, items in enumerate(self.cell_items):
+            position = self.first_row + offset
+            row = self.displayed_row(position) if position < count else None
+            for (name, label, width), item in zip(self.grid_columns, items):
+                text = self.format_cell(name, self.store.value(name, row)) if row is not None else ""
+                if self.cell_text.get(item) != text:
+                    self.cell_text[item] = text
+                    self.canvas.itemconfig(item, text=text)
+        
+        if count:
+            first = self.first_row / count
+            last = min(1.0, (self.first_row + len(self.cell_items)) / count)
+        else:
+            first, last = 0.0, 1.0
+        self.scrollbar.set(first, last)
+    
+    def scroll_to(self, first_row):
+        max_first = max(0, self.displayed_count() - len(self.cell_items) + 1)
+        first_row = max(0, min(int(first_row), max_first))
+        if first_row != self.first_row:
+            self.first_row = first_row
+            self.schedule_render()
+    
+    def scroll_by(self, rows):
+        if self.store is not None:
+            self.scroll_to(self.first_row + rows)
+    
+    def on_scrollbar(self, action, amount, unit=None):
+        if self.store is None:
+            return
+        if action == "moveto":
+            self.scroll_to(float(amount) * self.displayed_count())
+        elif action == "scroll":
+            step = len(self.cell_items) - 1 if unit == "pages" else 1
+            self.scroll_by(int(amount) * step)
+    
+    def on_mouse_wheel(self, event):
+        self.scroll_by(-3 if event.delta > 0 else 3)
+    
+    def on_canvas_click(self, event):
+        if self.store is None or event.y > self.header_height:
+            return
+        x = 0
+        for name, label, width in self.grid_columns:
+            if x <= event.x < x + width:
+                self.sort_by(name)
+                return
+            x += width
+    
+    def sort_by(self, column):
+        sort_column, descending = self.pending_sort or (self.sort_column, self.sort_descending)
+        descending = not descending if column == sort_column else False
+        if self.indexer.is_ready(column):
+            self.apply_sort(column, descending)
+            return
+        self.pending_sort = column, descending
+        self.indexer.prioritize(column)
+        self.status_label.config(text="Sorting...")
+        self.update_header_labels()
+    
+    def apply_sort(self, column, descending):
+        self.pending_sort = None
+        self.sort_column = column
+        self.sort_descending = descending
+        self.update_order()
+        self.update_header_labels()
+        self.schedule_render()
+    
+    def run_indexer(self):
+        done = self.indexer.step()
+        if self.pending_sort and self.indexer.is_ready(self.pending_sort[0]):
+            self.apply_sort(*self.pending_sort)
+        if not done:
+            self.frame.after(1, self.run_indexer)
+    
+    def on_filter_changed(self, event=None):
+        if self.filter is None:
+            return
+        self.filter.set_query(self.filter_entry.get())
+        if not self.filter_pending:
+            self.filter_pending = True
+            self.frame.after(0, self.run_filter)
+    
+    def run_filter(self):
+        if not self.filter.step():
+            self.frame.after(1, self.run_filter)
+            return
+        self.filter_pending = False
+        self.update_order()
+        self.schedule_render()
+
+
+class SearchIndex:
+    max_prefix = 6
+    fuzzy_candidates = 400
+    
+    def __init__(self):
+        self.entries = {}
+        self.title_prefixes = {}
+        self.word_prefixes = {}
+        self.trigrams = {}
+        self.next_id = 0
+    
+    def __len__(self):
+        return len(self.entries)
+    
+    def words(self, text):
+        return text.lower().replace(":", " ").replace("-", " ").split()
+    
+    def grams(self, text):
+        text = f" {text.lower()} "
+        return frozenset(text[i:i + 3] for i in range(len(text) - 2))
+    
+    def keys(self, lowered, words, grams):
+        for length in range(1, min(len(lowered), self.max_prefix) + 1):
+            yield self.title_prefixes, lowered[:length]
+        for word in set(words):
+            for length in range(1, min(len(word), self.max_prefix) + 1):
+                yield self.word_prefixes, word[:length]
+        for gram in grams:
+            yield self.trigrams, gram
+    
+    def add(self, title, kind, action):
+        entry_id = self.next_id
+        self.next_id += 1
+        lowered = title.lower()
+        words = self.words(title)
+        grams = self.grams(title)
+        rank = len(title) << 32 | entry_id
+        self.entries[entry_id] = (title, kind, action, lowered, words, grams, rank)
+        for postings, key in self.keys(lowered, words, grams):
+            bisect.insort(postings.setdefault(key, []), rank)
+        return entry_id
+    
+    def remove(self, entry_id):
+        title, kind, action, lowered, words, grams, rank = self.entries.pop(entry_id)
+        for postings, key in self.keys(lowered, words, grams):
+            ranks = postings[key]
+            del ranks[bisect.bisect_left(ranks, rank)]
+    
+    def intersect(self, lists):
+        lists = sorted(lists, key=len)
+        if not lists or not lists[0]:
+            return
+        positions = [0] * len(lists)
+        candidate = lists[0][0]
+        while True:
+            for i, ranks in enumerate(lists):
+                position = bisect.bisect_left(ranks, candidate, positions[i])
+                if position == len(ranks):
+                    return
+                positions[i] = position
+                if ranks[position] != candidate:
+                    candidate = ranks[position]
+                    break
+            else:
+                yield candidate
+                positions[0] += 1
+                if positions[0] == len(lists[0]):
+                    return
+                candidate = lists[0][positions[0]]
+    
+    def collect(self, lists, matches, results, seen, limit):
+        for rank in self.intersect(lists):
+            entry_id = rank & 0xffffffff
+            if entry_id not in seen and matches(self.entries[entry_id]):
+                seen.add(entry_id)
+                results.append(entry_id)
+                if len(results) >= limit:
+                    return
+    
+    def search(self, query, limit=8):
+        query = " ".join(query.lower().split())
+        if not query:
+            return []
+        tokens = self.words(query)
+        token_lists = [self.word_prefixes.get(token[:self.max_prefix], []) for token in tokens]
+        results = []
+        seen = set()
+        
+        self.collect(
+            [self.title_prefixes.get(query[:self.max_prefix], [])] + token_lists,
+            lambda entry: entry[3].startswith(query),
+            results, seen, limit
         )
-        label.pack(side=tk.LEFT)
         
-        var = tk.BooleanVar(value=default_value)
-        checkbox = tk.Checkbutton(
-            item_frame,
-            variable=var,
-            bg="white",
-            cursor="hand2"
-        )
-        checkbox.pack(side=tk.RIGHT)
+        if len(results) < limit and tokens:
+            self.collect(
+                token_lists,
+                lambda entry: all(any(word.startswith(token) for word in entry[4]) for token in tokens),
+                results, seen, limit
+            )
+        
+        if len(results) < limit and len(query) >= 3:
+            query_grams = self.grams(query)
+            candidates = set()
+            for gram in sorted(query_grams, key=lambda gram: len(self.trigrams.get(gram, ()))):
+                ranks = self.trigrams.get(gram, ())
+                if candidates and len(candidates) + len(ranks) > self.fuzzy_candidates:
+                    break
+                candidates.update(rank & 0xffffffff for rank in ranks[:self.fuzzy_candidates])
+            
+            threshold = max(1, len(query_grams) // 2)
+            scored = []
+            for entry_id in candidates - seen:
+                entry = self.entries[entry_id]
+                shared = len(query_grams) if query in entry[3] else len(query_grams & entry[5])
+                if shared >= threshold:
+                    scored.append((-shared, entry[6], entry_id))
+            results.extend(entry_id for shared, rank, entry_id in heapq.nsmallest(limit - len(results), scored))
+        
+        return [self.entries[entry_id][:3] for entry_id in results]
+
+
+class CommandPalette:
+    result_count = 8
     
-    def create_input_field(self, parent, label_text, default_value):
-        field_frame = tk.Frame(parent, bg="white")
-        field_frame.pack(fill=tk.X, pady=10)
+    def __init__(self, app):
+        self.app = app
+        self.index = SearchIndex()
+        self.results = []
+        self.selected = 0
+        self.is_open = False
         
-        label = tk.Label(
-            field_frame,
-            text=label_text,
-            font=("Arial", 11),
-            bg="white",
-            fg="#7f8c8d",
-            width=15,
-            anchor="w"
-        )
-        label.pack(side=tk.LEFT)
+        self.frame = tk.Frame(app.root, bg="#1a252f", bd=0)
         
-        entry = tk.Entry(
-            field_frame,
-            font=("Arial", 11),
-            bg="#ecf0f1",
+        self.entry = tk.Entry(
+            self.frame,
+            font=("Arial", 14),
+            bg="#34495e",
+            fg="white",
+            insertbackground="white",
             relief=tk.FLAT,
-            bd=5
+            bd=8,
+            width=40
         )
-        entry.insert(0, default_value)
-        entry.pack(side=tk.LEFT, fill=tk.X, expand=True)
+        self.entry.pack(fill=tk.X, padx=10, pady=10)
+        self.entry.bind("<KeyRelease>", self.on_key_release)
+        self.entry.bind("<Return>", lambda event: self.run_selected())
+        self.entry.bind("<Escape>", lambda event: self.close())
+        self.entry.bind("<Down>", lambda event: self.move_selection(1))
+        self.entry.bind("<Up>", lambda event: self.move_selection(-1))
+        
+        self.result_labels = []
+        for i in range(self.result_count):
+            label = tk.Label(
+                self.frame,
+                text="",
+                font=("Arial", 11),
+                bg="#1a252f",
+                fg="white",
+                anchor="w",
+                padx=12,
+                pady=4,
+                cursor="hand2"
+            )
+            label.bind("<Button-1>", lambda event, i=i: self.run_result(i))
+            self.result_labels.append(label)
+        
+        app.root.bind("<Control-k>", self.on_shortcut)
+        app.root.bind("<Control-p>", self.on_shortcut)
+        app.root.bind_class("Entry", "<Control-k>", self.on_shortcut)
+    
+    def on_shortcut(self, event=None):
+        self.toggle()
+        return "break"
+    
+    def add(self, title, kind, action):
+        return self.index.add(title, kind, action)
+    
+    def toggle(self):
+        if self.is_open:
+            self.close()
+        else:
+            self.open()
+    
+    def open(self):
+        self.is_open = True
+        self.entry.delete(0, tk.END)
+        self.update_results()
+        self.frame.place(relx=0.5, rely=0.12, anchor="n")
+        self.frame.lift()
+        self.entry.focus_set()
+    
+    def close(self):
+        self.is_open = False
+        self.frame.place_forget()
+    
+    def on_key_release(self, event):
+        if event.keysym in ("Up", "Down", "Return", "Escape"):
+            return
+        self.update_results()
+    
+    def update_results(self):
+        self.results = self.index.search(self.entry.get(), self.result_count)
+        self.selected = 0
+        self.render_results()
+    
+    def render_results(self):
+        for i, label in enumerate(self.result_labels):
+            if i < len(self.results):
+                title, kind, action = self.results[i]
+                label.config(text=f"{title}    {kind}", bg="#3498db" if i == self.selected else "#1a252f")
+                if not label.winfo_ismapped():
+                    label.pack(fill=tk.X, padx=10)
+            elif label.winfo_ismapped():
+                label.pack_forget()
+    
+    def move_selection(self, delta):
+        if self.results:
+            self.selected = (self.selected + delta) % len(self.results)
+            self.render_results()
+        return "break"
+    
+    def run_selected(self):
+        self.run_result(self.selected)
+    
+    def run_result(self, i):
+        if i >= len(self.results):
+            return
+        title, kind, action = self.results[i]
+        self.close()
+        action()
 
 
-class AboutView(BaseView):
-    def setup_ui(self):
-        header = tk.Frame(self.frame, bg="#e74c3c", height=80)
-        header.pack(fill=tk.X)
-        header.pack_propagate(False)
-        
-        title = tk.Label(
-            header,
-            text="ℹ️ About",
-            font=("Arial", 24, "bold"),
-            bg="#e74c3c",
-            fg="white"
-        )
-        title.pack(pady=20)
-        
-        content = tk.Frame(self.frame, bg="#ecf0f1")
-        content.pack(fill=tk.BOTH, expand=True, padx=40, pady=40)
+class InteractionRecorder:
+    def __init__(self, app):
+        self.app = app
+        self.events = []
+        self.start_time = None
+        self.last_size = None
+        self.recording = False
+        self.bound = False
+    
+    def start(self):
+        self.events = []
+        self.start_time = time.monotonic()
+        self.last_size = (self.app.root.winfo_width(), self.app.root.winfo_height())
+        self.recording = True
+        if self.bound:
+            return
+        self.bound = True
         
-        about_card = tk.Frame(content, bg="white", relief=tk.RAISED, bd=2)
-        about_card.pack(fill=tk.BOTH, expand=True)
+        for index, item in enumerate(self.app.sidebar.menu_items):
+            for widget in (item.frame, item.icon_label, item.text_label):
+                widget.bind("<Button-1>", lambda event, i=index: self.record("click", i), add="+")
+                widget.bind("<Enter>", lambda event, i=index: self.record("enter", i), add="+")
+                widget.bind("<Leave>", lambda event, i=index: self.record("leave", i), add="+")
+        self.app.root.bind("<Configure>", self.on_configure, add="+")
         
-        about_content = tk.Frame(about_card, bg="white")
-        about_content.pack(fill=tk.BOTH, expand=True, padx=40, pady=40)
+        sidebar = self.app.sidebar
         
-        app_title = tk.Label(
-            about_content,
-            text="Complex GUI Application",
-            font=("Arial", 20, "bold"),
-            bg="white",
-            fg="#2c3e50"
-        )
-        app_title.pack(pady=(0, 10))
+        def toggle():
+            self.record("toggle")
+            sidebar.toggle()
         
-        version = tk.Label(
-            about_content,
-            text="Version 1.0.0",
-            font=("Arial", 11),
-            bg="white",
-            fg="#7f8c8d"
-        )
-        version.pack(pady=(0, 30))
-        
-        description = tk.Label(
-            about_content,
-            text="This is a demonstration of advanced tkinter GUI development\n"
-                 "featuring smooth animations, responsive design, and modern UI patterns.\n\n"
-                 "Built with Python and tkinter, this application showcases:\n\n"
-                 "• Custom animation engine with easing functions\n"
-                 "• Collapsible sidebar navigation\n"
-                 "• Multiple view management\n"
-                 "• Smooth transitions and hover effects\n"
-                 "• Responsive layout that adapts to window resizing\n"
-                 "• Clean, modern design principles\n\n"
-                 "Technologies Used:\n"
-                 "• Python 3.x\n"
-                 "• tkinter (standard library)\n"
-                 "• Custom animation framework\n\n",
-            font=("Arial", 11),
-            bg="white",
-            fg="#34495e",
-            justify=tk.LEFT
-        )
-        description.pack(pady=20)
-        
-        footer = tk.Label(
-            about_content,
-            text="© 2024 Complex GUI Application. All rights reserved.",
-            font=("Arial", 9),
-            bg="white",
-            fg="#95a5a6"
-        )
-        footer.pack(side=tk.BOTTOM, pady=(20, 0))
+        sidebar.toggle_btn.config(command=toggle)
+    
+    def stop(self):
+        self.recording = False
+    
+    def record(self, kind, *args):
+        if not self.recording:
+            return
+        elapsed_ms = int((time.monotonic() - self.start_time) * 1000)
+        self.events.append([elapsed_ms, kind] + list(args))
+    
+    def on_configure(self, event):
+        if event.widget is not self.app.root:
+            return
+        size = (event.width, event.height)
+        if size != self.last_size:
+            self.last_size = size
+            self.record("resize", event.width, event.height)
+    
+    def save(self, path):
+        with open(path, "w", encoding="utf-8") as trace_file:
+            json.dump({"version": 1, "events": self.events}, trace_file, separators=(",", ":"))
+
+
+class TraceReplayer:
+    def __init__(self, app, events, speed=1.0, on_complete=None):
+        self.app = app
+        self.events = events
+        self.speed = speed
+        self.on_complete = on_complete
+        self.index = 0
+        self.start_time = None
+        self.stats = None
+    
+    @classmethod
+    def load(cls, app, path, speed=1.0, on_complete=None):
+        with open(path, encoding="utf-8") as trace_file:
+            trace = json.load(trace_file)
+        return cls(app, trace["events"], speed, on_complete)
+    
+    def start(self):
+        self.stats = self.app.animation_engine.enable_instrumentation()
+        self.stats.reset()
+        self.index = 0
+        self.start_time = time.monotonic()
+        self.schedule_next()
+    
+    def schedule_next(self):
+        if self.index >= len(self.events):
+            self.app.root.after(0, self.wait_for_animations)
+            return
+        delay = 0
+        if self.speed:
+            due = self.events[self.index][0] / 1000.0 / self.speed
+            delay = max(0, int((due - (time.monotonic() - self.start_time)) * 1000))
+        self.app.root.after(delay, self.dispatch_next)
+    
+    def dispatch_next(self):
+        event = self.events[self.index]
+        self.index += 1
+        self.dispatch(event[1], *event[2:])
+        self.schedule_next()
+    
+    def dispatch(self, kind, *args):
+        sidebar = self.app.sidebar
+        if kind == "click":
+            sidebar.menu_items[args[0]].on_click(None)
+        elif kind == "enter":
+            sidebar.menu_items[args[0]].on_enter(None)
+        elif kind == "leave":
+            sidebar.menu_items[args[0]].on_leave(None)
+        elif kind == "toggle":
+            sidebar.toggle()
+        elif kind == "resize":
+            self.app.root.geometry(f"{args[0]}x{args[1]}")
+    
+    def wait_for_animations(self):
+        if not self.app.animation_engine.is_idle():
+            self.app.root.after(int(self.app.animation_engine.frame_interval * 1000), self.wait_for_animations)
+            return
+        result = {
+            "events": len(self.events),
+            "speed": self.speed,
+            "wall_ms": (time.monotonic() - self.start_time) * 1000,
+            "frames": self.stats.snapshot(),
+        }
+        if self.on_complete:
+            self.on_complete(result)
+
+
+class SessionStore:
+    version = 1
+    
+    def __init__(self, path):
+        self.path = path
+        self.condition = threading.Condition()
+        self.pending = None
+        self.thread = None
+        self.closed = False
+    
+    def load(self):
+        try:
+            with open(self.path, encoding="utf-8") as session_file:
+                state = json.load(session_file)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(state, dict) or state.get("version") != self.version:
+            return None
+        return state
+    
+    def save(self, state):
+        state = dict(state, version=self.version, saved_at=time.time())
+        temp_path = self.path + ".tmp"
+        with open(temp_path, "w", encoding="utf-8") as session_file:
+            json.dump(state, session_file, separators=(",", ":"))
+        os.replace(temp_path, self.path)
+    
+    def save_async(self, state):
+        with self.condition:
+            self.pending = state
+            if self.thread is None:
+                self.thread = threading.Thread(target=self.run, name="SessionStore", daemon=True)
+                self.thread.start()
+            self.condition.notify()
+    
+    def run(self):
+        while True:
+            with self.condition:
+                while self.pending is None and not self.closed:
+                    self.condition.wait()
+                if self.pending is None:
+                    return
+                state, self.pending = self.pending, None
+            try:
+                self.save(state)
+            except OSError:
+                pass
+    
+    def close(self, final_state=None):
+        with self.condition:
+            if final_state is not None:
+                self.pending = None
+            self.closed = True
+            self.condition.notify()
+        if self.thread is not None:
+            self.thread.join(timeout=5.0)
+            self.thread = None
+        if final_state is not None:
+            try:
+                self.save(final_state)
+            except OSError:
+                pass
 
 
 class ComplexGUIApp:
-    def __init__(self, root):
+    def __init__(self, root, enable_watchdog=False, enable_frame_stats=False, enable_tcl_profiler=False,
+                 clock=None, frame_rate=60, session=None, watchdog_log=StallWatchdog.default_log_path):
         self.root = root
+        self.tcl_profiler = None
+        if enable_tcl_profiler:
+            self.tcl_profiler = TclProfiler(self.root)
+            self.tcl_profiler.install()
+        
         self.root.title("Complex GUI Application")
         self.root.geometry("1200x700")
         self.root.minsize(800, 500)
         
         self.root.configure(bg="#ecf0f1")
         
-        self.animation_engine = AnimationEngine(self.root)
+        self.animation_engine = AnimationEngine(self.root, clock, frame_rate)
+        if enable_frame_stats:
+            self.animation_engine.enable_instrumentation()
         
         self.main_container = tk.Frame(self.root, bg="#ecf0f1")
         self.main_container.pack(fill=tk.BOTH, expand=True)
         
-        self.sidebar = Sidebar(self.main_container, self.animation_engine, self.navigate_to_page)
+        self.icons = IconAtlas(self.root)
+        with startup_tracer.span("Sidebar"):
+            self.sidebar = Sidebar(self.main_container, self.animation_engine, self.navigate_to_page, self.icons)
         
         self.content_area = tk.Frame(self.main_container, bg="#ecf0f1")
         self.content_area.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         
-        self.views = {
-            "home": HomeView(self.content_area, self.animation_engine),
-            "dashboard": DashboardView(self.content_area, self.animation_engine),
-            "settings": SettingsView(self.content_area, self.animation_engine),
-            "about": AboutView(self.content_area, self.animation_engine)
-        }
+        with startup_tracer.span("CommandPalette"):
+            self.command_palette = CommandPalette(self)
+            self.command_palette.add("Toggle Sidebar", "Action", self.sidebar.toggle)
+        
+        self.views = {}
+        self.widget_pool = WidgetPool(self.content_area)
+        self.register_view("home", HomeView(self.content_area, self.animation_engine, self.widget_pool, self.open_page))
+        self.register_view("dashboard", DashboardView(self.content_area, self.animation_engine, self.icons))
+        self.register_view("settings", SettingsView(self.content_area, self.animation_engine, self.widget_pool))
+        self.register_view("about", AboutView(self.content_area, self.animation_engine, self.widget_pool))
+        self.register_view("data", DataGridView(self.content_area, self.animation_engine), "Data Grid")
         
         self.current_view = None
-        self.navigate_to_page("home")
+        self.autosave_id = None
+        with startup_tracer.span("initial page"):
+            if session:
+                self.restore_session(session)
+            else:
+                self.navigate_to_page("home")
         
         self.root.bind("<Configure>", self.on_window_resize)
+        
+        self.watchdog = None
+        if enable_watchdog:
+            self.watchdog = StallWatchdog(self.root, self.animation_engine, log_path=watchdog_log)
+            self.watchdog.start()
+    
+    def register_view(self, page_name, view, title=None):
+        self.views[page_name] = view
+        self.command_palette.add(title or page_name.capitalize(), "Page", lambda: self.open_page(page_name))
+        for label in getattr(view, "settings", {}):
+            self.command_palette.add(
+                f"{title or page_name.capitalize()}: {label}",
+                "Setting",
+                lambda label=label: self.open_page(page_name, label)
+            )
+    
+    def open_page(self, page_name, setting=None):
+        if any(item.text.lower() == page_name for item in self.sidebar.menu_items):
+            self.sidebar.navigate_to(page_name)
+        else:
+            self.navigate_to_page(page_name)
+        if setting is not None:
+            self.views[page_name].focus_setting(setting)
     
     def navigate_to_page(self, page_name):
         if page_name not in self.views:
@@ -692,12 +2758,115 @@ class ComplexGUIApp:
     
     def on_window_resize(self, event):
         pass
+    
+    def current_page(self):
+        for page_name, view in self.views.items():
+            if view is self.current_view:
+                return page_name
+        return None
+    
+    def snapshot_state(self):
+        return {
+            "page": self.current_page(),
+            "sidebar_expanded": self.sidebar.is_expanded,
+            "dashboard": self.views["dashboard"].snapshot(),
+        }
+    
+    def restore_session(self, session):
+        page_name = session.get("page")
+        expanded = session.get("sidebar_expanded", True)
+        dashboard_state = session.get("dashboard")
+        if (not isinstance(page_name, (str, type(None))) or not isinstance(expanded, bool)
+                or not isinstance(dashboard_state, (dict, type(None)))):
+            self.navigate_to_page("home")
+            return
+        dashboard = self.views["dashboard"]
+        if dashboard_state:
+            try:
+                dashboard.restore(dashboard_state)
+            except (KeyError, TypeError, ValueError):
+                dashboard.reset()
+                self.navigate_to_page("home")
+                return
+        
+        self.sidebar.set_expanded(expanded)
+        if page_name == "home" or page_name not in self.views:
+            self.navigate_to_page("home")
+        else:
+            self.open_page(page_name)
+        
+        self.root.after_idle(lambda: self.root.after(0, dashboard.refresh))
+    
+    def start_session_autosave(self, store, interval=30000):
+        def autosave():
+            store.save_async(self.snapshot_state())
+            self.autosave_id = self.root.after(interval, autosave)
+        
+        self.autosave_id = self.root.after(interval, autosave)
+
+
+startup_tracer = StartupTracer(os.environ.get("COMPLEX_GUI_STARTUP_TRACE"))
+startup_tracer.add_span("import tkinter", IMPORT_STARTED, TKINTER_IMPORTED)
+startup_tracer.add_span("import complex_gui_app", IMPORT_STARTED, time.perf_counter())
+
+
+def trace_first_paint(root):
+    def on_map(event):
+        if event.widget is root:
+            root.unbind("<Map>", binding)
+            root.after_idle(on_first_paint)
+    
+    def on_first_paint():
+        startup_tracer.mark("first mapped frame")
+        startup_tracer.add_span("startup", startup_tracer.process_start, time.perf_counter())
+        startup_tracer.write()
+    
+    binding = root.bind("<Map>", on_map, add="+")
 
 
 def main():
-    root = tk.Tk()
-    app = ComplexGUIApp(root)
+    frame_stats_path = os.environ.get("COMPLEX_GUI_FRAME_STATS")
+    watchdog_setting = os.environ.get("COMPLEX_GUI_WATCHDOG", "").strip().lower()
+    session_path = os.environ.get("COMPLEX_GUI_SESSION", os.path.expanduser("~/.complex_gui_session.json"))
+    session_store = SessionStore(session_path) if session_path else None
+    with startup_tracer.span("tk.Tk()"):
+        root = tk.Tk()
+    if startup_tracer.enabled:
+        trace_first_paint(root)
+    with startup_tracer.span("ComplexGUIApp()"):
+        app = ComplexGUIApp(
+            root,
+            enable_watchdog=watchdog_setting not in ("", "0", "false", "no", "off"),
+            watchdog_log=os.environ.get("COMPLEX_GUI_WATCHDOG_LOG") or StallWatchdog.default_log_path,
+            enable_frame_stats=bool(frame_stats_path),
+            enable_tcl_profiler=bool(os.environ.get("COMPLEX_GUI_TCL_PROFILE")),
+            frame_rate=int(os.environ.get("COMPLEX_GUI_FRAME_RATE", 60)),
+            session=session_store.load() if session_store else None
+        )
+    if session_store:
+        app.start_session_autosave(session_store)
+    if startup_tracer.enabled:
+        with startup_tracer.span("initial layout"):
+            root.update_idletasks()
+    record_path = os.environ.get("COMPLEX_GUI_RECORD")
+    recorder = None
+    if record_path:
+        recorder = InteractionRecorder(app)
+        recorder.start()
     root.mainloop()
+    try:
+        if recorder:
+            recorder.stop()
+            recorder.save(record_path)
+        if app.watchdog:
+            app.watchdog.stop()
+        if app.tcl_profiler:
+            print(app.tcl_profiler.report())
+        if frame_stats_path:
+            app.animation_engine.stats.dump_json(frame_stats_path)
+    finally:
+        if session_store:
+            session_store.close(app.snapshot_state())
 
 
 if __name__ == "__main__":
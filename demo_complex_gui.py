@@ -11,7 +11,7 @@ import os
 os.environ['DISPLAY'] = ':99'
 
 try:
-    from complex_gui_app import ComplexGUIApp
+    from complex_gui_app import ComplexGUIApp, VirtualClock
     
     print("=" * 60)
     print("Complex GUI Application - Feature Demonstration")
@@ -19,7 +19,9 @@ try:
     
     print("\n1. Initializing application...")
     root = tk.Tk()
-    app = ComplexGUIApp(root)
+    clock = VirtualClock()
+    app = ComplexGUIApp(root, clock=clock)
+    clock.run_until_idle()
     root.update()
     print("   ✓ Application window created (1200x700)")
     print("   ✓ Sidebar initialized (expanded mode)")
@@ -30,27 +32,28 @@ try:
     pages = ["home", "dashboard", "settings", "about"]
     for page in pages:
         app.navigate_to_page(page)
+        clock.run_until_idle()
         root.update()
         print(f"   ✓ Navigated to {page.capitalize()} view")
     
     print("\n3. Testing sidebar animations...")
     print("   - Collapsing sidebar...")
     app.sidebar.toggle()
-    for i in range(20):
-        root.update()
+    clock.run_until_idle()
+    root.update()
     print("   ✓ Sidebar collapsed to 60px width")
     
     print("   - Expanding sidebar...")
     app.sidebar.toggle()
-    for i in range(20):
-        root.update()
+    clock.run_until_idle()
+    root.update()
     print("   ✓ Sidebar expanded to 220px width")
     
     print("\n4. Testing view transitions...")
     for i, page in enumerate(["dashboard", "settings", "about", "home"]):
         app.navigate_to_page(page)
-        for j in range(15):
-            root.update()
+        clock.run_until_idle()
+        root.update()
         print(f"   ✓ Transition {i+1}/4: Fade animation completed")
     
     print("\n5. Verifying component structure...")
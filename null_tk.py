@@ -0,0 +1,650 @@
+"""
+Null Tk backend for the Complex GUI Application
+Implements the subset of tkinter used by complex_gui_app in plain Python,
+recording widget creation, configuration and geometry calls in memory
+"""
+
+from collections import Counter
+
+from clocks import VirtualClock
+
+
+TkVersion = "null"
+
+X = "x"
+Y = "y"
+BOTH = "both"
+NONE = "none"
+LEFT = "left"
+RIGHT = "right"
+TOP = "top"
+BOTTOM = "bottom"
+CENTER = "center"
+N = "n"
+S = "s"
+E = "e"
+W = "w"
+NW = "nw"
+NE = "ne"
+SW = "sw"
+SE = "se"
+RAISED = "raised"
+SUNKEN = "sunken"
+FLAT = "flat"
+RIDGE = "ridge"
+GROOVE = "groove"
+SOLID = "solid"
+HORIZONTAL = "horizontal"
+VERTICAL = "vertical"
+END = "end"
+ALL = "all"
+
+OPTION_ALIASES = {
+    "bg": "background",
+    "fg": "foreground",
+    "bd": "borderwidth",
+}
+
+
+class TclError(Exception):
+    pass
+
+
+class CallLog:
+    def __init__(self, keep_entries=True):
+        self.keep_entries = keep_entries
+        self.entries = []
+        self.counts = Counter()
+    
+    def record(self, path, operation, *args):
+        self.counts[operation] += 1
+        if self.keep_entries:
+            self.entries.append((path, operation) + args)
+    
+    def total(self):
+        return sum(self.counts.values())
+    
+    def reset(self):
+        self.entries = []
+        self.counts = Counter()
+
+
+class Event:
+    def __init__(self, widget, **kw):
+        self.widget = widget
+        self.x = 0
+        self.y = 0
+        self.x_root = 0
+        self.y_root = 0
+        self.width = 0
+        self.height = 0
+        self.delta = 0
+        self.keysym = ""
+        self.char = ""
+        self.__dict__.update(kw)
+
+
+def normalize_options(options):
+    return {OPTION_ALIASES.get(key, key): value for key, value in options.items()}
+
+
+class Misc:
+    def setup_misc(self, root):
+        self.root = root
+        self.options = {}
+        self.children = {}
+        self.bindings = {}
+        self.manager = None
+        self.geometry_options = {}
+        self.propagate = True
+    
+    def record(self, operation, *args):
+        self.root.log.record(self.path, operation, *args)
+    
+    def configure(self, cnf=None, **kw):
+        if cnf:
+            kw = dict(cnf, **kw)
+        if not kw:
+            return dict(self.options)
+        options = normalize_options(kw)
+        self.options.update(options)
+        self.record("configure", options)
+    
+    config = configure
+    
+    def cget(self, key):
+        key = OPTION_ALIASES.get(key, key)
+        self.record("cget", key)
+        if key not in self.options:
+            raise TclError(f'unknown option "-{key}"')
+        return self.options[key]
+    
+    __getitem__ = cget
+    
+    def __setitem__(self, key, value):
+        self.configure({key: value})
+    
+    def keys(self):
+        return list(self.options)
+    
+    def bind(self, sequence=None, func=None, add=None):
+        if sequence is None:
+            return list(self.bindings)
+        if func is None:
+            return self.bindings.get(sequence, [])
+        handlers = self.bindings.setdefault(sequence, [])
+        if not add:
+            handlers.clear()
+        handlers.append(func)
+        self.record("bind", sequence)
+        return f"{id(func)}{sequence}"
+    
+    def unbind(self, sequence, funcid=None):
+        self.bindings.pop(sequence, None)
+        self.record("unbind", sequence)
+    
+    def bind_class(self, class_name, sequence=None, func=None, add=None):
+        bindings = self.root.class_bindings.setdefault(class_name, {})
+        if sequence is None:
+            return list(bindings)
+        if func is None:
+            return bindings.get(sequence, [])
+        handlers = bindings.setdefault(sequence, [])
+        if not add:
+            handlers.clear()
+        handlers.append(func)
+        self.record("bind_class", class_name, sequence)
+        return f"{id(func)}{sequence}"
+    
+    def bindtags(self):
+        tags = [self, type(self).__name__]
+        if self is not self.root:
+            tags.append(self.root)
+        return tags
+    
+    def event_generate(self, sequence, **kw):
+        self.record("event_generate", sequence)
+        event = Event(self, **kw)
+        for tag in self.bindtags():
+            bindings = tag.bindings if isinstance(tag, Misc) else self.root.class_bindings.get(tag, {})
+            for handler in list(bindings.get(sequence, [])):
+                if handler(event) == "break":
+                    return
+    
+    def after(self, ms, func=None, *args):
+        if func is None:
+            self.root.clock.advance(ms / 1000.0)
+            return None
+        return self.root.clock.after(ms, lambda: func(*args))
+    
+    def after_idle(self, func, *args):
+        return self.after(0, func, *args)
+    
+    def after_cancel(self, after_id):
+        self.root.clock.after_cancel(after_id)
+    
+    def update(self):
+        self.root.clock.advance(0)
+    
+    def update_idletasks(self):
+        pass
+    
+    def focus_set(self):
+        self.root.focus_widget = self
+    
+    focus = focus_set
+    
+    def winfo_children(self):
+        return list(self.children.values())
+    
+    def winfo_exists(self):
+        return 1
+    
+    def winfo_ismapped(self):
+        widget = self
+        while widget is not self.root:
+            if widget.manager is None:
+                return 0
+            widget = widget.geometry_options.get("in_", widget.master)
+        return 1
+    
+    def winfo_width(self):
+        if not self.winfo_ismapped():
+            return 1
+        return int(self.options.get("width") or 1)
+    
+    def winfo_height(self):
+        if not self.winfo_ismapped():
+            return 1
+        return int(self.options.get("height") or 1)
+    
+    def winfo_reqwidth(self):
+        return int(self.options.get("width") or 1)
+    
+    def winfo_reqheight(self):
+        return int(self.options.get("height") or 1)
+    
+    def winfo_toplevel(self):
+        return self.root
+    
+    def pack_propagate(self, flag=None):
+        if flag is None:
+            return self.propagate
+        self.propagate = bool(flag)
+        self.record("pack_propagate", self.propagate)
+    
+    grid_propagate = pack_propagate
+    
+    def grid_columnconfigure(self, index, **kw):
+        self.record("grid_columnconfigure", index, kw)
+    
+    columnconfigure = grid_columnconfigure
+    
+    def grid_rowconfigure(self, index, **kw):
+        self.record("grid_rowconfigure", index, kw)
+    
+    rowconfigure = grid_rowconfigure
+
+
+class Tk(Misc):
+    def __init__(self, clock=None, keep_entries=True):
+        self.setup_misc(self)
+        self.master = None
+        self.path = "."
+        self.name_counts = Counter()
+        self.clock = clock or VirtualClock()
+        self.log = CallLog(keep_entries)
+        self.class_bindings = {}
+        self.manager = "wm"
+        self.focus_widget = None
+        self.destroyed = False
+        self.options.update({"width": 200, "height": 200, "background": "#d9d9d9"})
+    
+    def title(self, string=None):
+        if string is None:
+            return self.options.get("title", "tk")
+        self.options["title"] = string
+        self.record("wm title", string)
+    
+    def geometry(self, new_geometry=None):
+        if new_geometry is None:
+            return f"{self.options['width']}x{self.options['height']}+0+0"
+        size = new_geometry.split("+")[0]
+        if "x" in size:
+            width, height = size.split("x")
+            self.options["width"] = int(width)
+            self.options["height"] = int(height)
+            for handler in list(self.bindings.get("<Configure>", [])):
+                handler(Event(self, width=self.options["width"], height=self.options["height"]))
+        self.record("wm geometry", new_geometry)
+    
+    def minsize(self, width=None, height=None):
+        self.record("wm minsize", width, height)
+    
+    def mainloop(self, n=0):
+        self.clock.run_until_idle()
+    
+    def quit(self):
+        pass
+    
+    def destroy(self):
+        for child in list(self.children.values()):
+            child.destroy()
+        self.destroyed = True
+        self.record("destroy")
+
+
+class Widget(Misc):
+    widget_name = "widget"
+    
+    def __init__(self, master=None, cnf=None, **kw):
+        root = master.root
+        self.setup_misc(root)
+        self.master = master
+        root.name_counts[self.widget_name] += 1
+        count = root.name_counts[self.widget_name]
+        name = f"!{self.widget_name}" if count == 1 else f"!{self.widget_name}{count}"
+        self.path = (master.path if master.path != "." else "") + "." + name
+        master.children[name] = self
+        self.options.update(self.defaults())
+        if cnf:
+            kw = dict(cnf, **kw)
+        self.options.update(normalize_options(kw))
+        self.record("create", self.widget_name, dict(self.options))
+    
+    def defaults(self):
+        return {"background": "#d9d9d9", "width": 0, "height": 0}
+    
+    def pack(self, cnf=None, **kw):
+        self.manager = "pack"
+        self.geometry_options = kw
+        self.record("pack", kw)
+    
+    pack_configure = pack
+    
+    def pack_forget(self):
+        self.manager = None
+        self.record("pack forget")
+    
+    def pack_info(self):
+        return dict(self.geometry_options)
+    
+    def grid(self, cnf=None, **kw):
+        self.manager = "grid"
+        self.geometry_options = kw
+        self.record("grid", kw)
+    
+    grid_configure = grid
+    
+    def grid_forget(self):
+        self.manager = None
+        self.record("grid forget")
+    
+    def place(self, cnf=None, **kw):
+        self.manager = "place"
+        self.geometry_options = kw
+        self.record("place", kw)
+    
+    place_configure = place
+    
+    def place_forget(self):
+        self.manager = None
+        self.record("place forget")
+    
+    def lift(self, above=None):
+        self.record("raise")
+    
+    tkraise = lift
+    
+    def destroy(self):
+        for child in list(self.children.values()):
+            child.destroy()
+        self.master.children.pop(self.path.rsplit(".", 1)[-1], None)
+        self.manager = None
+        self.record("destroy")
+
+
+class Frame(Widget):
+    widget_name = "frame"
+
+
+class Toplevel(Widget):
+    widget_name = "toplevel"
+    
+    def title(self, string=None):
+        self.options["title"] = string
+    
+    def geometry(self, new_geometry=None):
+        self.record("wm geometry", new_geometry)
+    
+    def overrideredirect(self, flag=None):
+        self.record("wm overrideredirect", flag)
+    
+    def transient(self, master=None):
+        self.record("wm transient")
+    
+    def withdraw(self):
+        self.manager = None
+        self.record("wm withdraw")
+    
+    def deiconify(self):
+        self.manager = "wm"
+        self.record("wm deiconify")
+
+
+class Label(Widget):
+    widget_name = "label"
+    
+    def defaults(self):
+        return {"background": "#d9d9d9", "foreground": "#000000", "text": "", "image": "", "width": 0, "height": 0}
+
+
+class Button(Label):
+    widget_name = "button"
+    
+    def invoke(self):
+        self.record("invoke")
+        command = self.options.get("command")
+        if command:
+            return command()
+
+
+class Checkbutton(Button):
+    widget_name = "checkbutton"
+    
+    def invoke(self):
+        variable = self.options.get("variable")
+        if variable is not None:
+            variable.set(not variable.get())
+        return super().invoke()
+
+
+class Entry(Widget):
+    widget_name = "entry"
+    
+    def __init__(self, master=None, cnf=None, **kw):
+        self.own_text = ""
+        super().__init__(master, cnf, **kw)
+    
+    @property
+    def text(self):
+        variable = self.options.get("textvariable")
+        return self.own_text if variable is None else variable.get()
+    
+    @text.setter
+    def text(self, value):
+        variable = self.options.get("textvariable")
+        if variable is None:
+            self.own_text = value
+        else:
+            variable.set(value)
+    
+    def insert(self, index, string):
+        position = len(self.text) if index == END else int(index)
+        self.text = self.text[:position] + string + self.text[position:]
+        self.record("insert", index, string)
+    
+    def delete(self, first, last=None):
+        start = len(self.text) if first == END else int(first)
+        if last is None:
+            end = start + 1
+        else:
+            end = len(self.text) if last == END else int(last)
+        self.text = self.text[:start] + self.text[end:]
+        self.record("delete", first, last)
+    
+    def get(self):
+        return self.text
+
+
+class Canvas(Widget):
+    widget_name = "canvas"
+    
+    def __init__(self, master=None, cnf=None, **kw):
+        super().__init__(master, cnf, **kw)
+        self.items = {}
+        self.next_id = 1
+    
+    def create(self, item_type, args, kw):
+        if len(args) == 1 and isinstance(args[0], (list, tuple)):
+            args = args[0]
+        item_id = self.next_id
+        self.next_id += 1
+        tags = kw.get("tags", ())
+        if isinstance(tags, str):
+            tags = (tags,)
+        self.items[item_id] = {"type": item_type, "coords": [float(value) for value in args],
+                               "options": kw, "tags": tuple(tags)}
+        self.record("create " + item_type, len(args))
+        return item_id
+    
+    def create_line(self, *args, **kw):
+        return self.create("line", args, kw)
+    
+    def create_rectangle(self, *args, **kw):
+        return self.create("rectangle", args, kw)
+    
+    def create_oval(self, *args, **kw):
+        return self.create("oval", args, kw)
+    
+    def create_polygon(self, *args, **kw):
+        return self.create("polygon", args, kw)
+    
+    def create_text(self, *args, **kw):
+        return self.create("text", args, kw)
+    
+    def create_image(self, *args, **kw):
+        return self.create("image", args, kw)
+    
+    def find_withtag(self, tag_or_id):
+        if tag_or_id == ALL:
+            return tuple(self.items)
+        if isinstance(tag_or_id, int):
+            return (tag_or_id,) if tag_or_id in self.items else ()
+        return tuple(item_id for item_id, item in self.items.items() if tag_or_id in item["tags"])
+    
+    def find_all(self):
+        return tuple(self.items)
+    
+    def find_overlapping(self, x1, y1, x2, y2):
+        found = []
+        for item_id, item in self.items.items():
+            xs = item["coords"][0::2]
+            ys = item["coords"][1::2]
+            if xs and min(xs) <= x2 and max(xs) >= x1 and min(ys) <= y2 and max(ys) >= y1:
+                found.append(item_id)
+        self.record("find overlapping")
+        return tuple(found)
+    
+    def delete(self, *tags_or_ids):
+        for tag_or_id in tags_or_ids:
+            for item_id in self.find_withtag(tag_or_id):
+                del self.items[item_id]
+        self.record("delete", len(tags_or_ids))
+    
+    def move(self, tag_or_id, dx, dy):
+        for item_id in self.find_withtag(tag_or_id):
+            coords = self.items[item_id]["coords"]
+            for index in range(0, len(coords), 2):
+                coords[index] += dx
+                coords[index + 1] += dy
+        self.record("move")
+    
+    def coords(self, tag_or_id, *args):
+        item_ids = self.find_withtag(tag_or_id)
+        if not item_ids:
+            return []
+        if len(args) == 1 and isinstance(args[0], (list, tuple)):
+            args = args[0]
+        if args:
+            self.items[item_ids[0]]["coords"] = [float(value) for value in args]
+            self.record("coords")
+        return list(self.items[item_ids[0]]["coords"])
+    
+    def itemconfigure(self, tag_or_id, cnf=None, **kw):
+        if cnf:
+            kw = dict(cnf, **kw)
+        for item_id in self.find_withtag(tag_or_id):
+            self.items[item_id]["options"].update(kw)
+        self.record("itemconfigure", kw)
+    
+    itemconfig = itemconfigure
+    
+    def itemcget(self, tag_or_id, option):
+        item_ids = self.find_withtag(tag_or_id)
+        return self.items[item_ids[0]]["options"].get(option, "") if item_ids else ""
+    
+    def tag_raise(self, tag_or_id, above=None):
+        self.record("raise")
+    
+    lift = tag_raise
+    
+    def tag_lower(self, tag_or_id, below=None):
+        self.record("lower")
+
+
+class Scrollbar(Widget):
+    widget_name = "scrollbar"
+    
+    def __init__(self, master=None, cnf=None, **kw):
+        super().__init__(master, cnf, **kw)
+        self.position = (0.0, 1.0)
+    
+    def set(self, first, last):
+        self.position = (float(first), float(last))
+        self.record("set", first, last)
+    
+    def get(self):
+        return self.position
+
+
+class Variable:
+    default = ""
+    
+    def __init__(self, master=None, value=None, name=None):
+        self.value = self.default if value is None else value
+        self.traces = []
+    
+    def get(self):
+        return self.value
+    
+    def set(self, value):
+        self.value = value
+        for callback in list(self.traces):
+            callback()
+    
+    def trace_add(self, mode, callback):
+        self.traces.append(lambda: callback("", "", mode))
+        return str(len(self.traces))
+
+
+class StringVar(Variable):
+    default = ""
+
+
+class IntVar(Variable):
+    default = 0
+
+
+class DoubleVar(Variable):
+    default = 0.0
+
+
+class BooleanVar(Variable):
+    default = False
+    
+    def get(self):
+        return bool(self.value)
+
+
+class PhotoImage:
+    count = 0
+    
+    def __init__(self, name=None, cnf=None, master=None, **kw):
+        PhotoImage.count += 1
+        self.name = name or f"pyimage{PhotoImage.count}"
+        self.master = master
+        if cnf:
+            kw = dict(cnf, **kw)
+        self.options = normalize_options(kw)
+        self.painted = 0
+        self.record("image create photo", dict(self.options))
+    
+    def __str__(self):
+        return self.name
+    
+    def record(self, operation, *args):
+        if self.master is not None:
+            self.master.root.log.record(self.name, operation, *args)
+    
+    def width(self):
+        return int(self.options.get("width", 0))
+    
+    def height(self):
+        return int(self.options.get("height", 0))
+    
+    def put(self, data, to=None):
+        if to is not None:
+            x0, y0, x1, y1 = to
+            self.painted += (x1 - x0) * (y1 - y0)
+        self.record("put", data, to)
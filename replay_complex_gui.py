@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Replay a recorded interaction trace against the Complex GUI Application
+Record a trace with COMPLEX_GUI_RECORD=trace.json python complex_gui_app.py
+"""
+
+import argparse
+import json
+import os
+import sys
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay an interaction trace")
+    parser.add_argument("trace", help="trace file written by InteractionRecorder")
+    parser.add_argument("--speed", type=float, default=1.0, help="replay speed, 0 for as fast as possible")
+    parser.add_argument("--repeat", type=int, default=1, help="number of times to replay the trace")
+    parser.add_argument("--output", help="write metrics JSON to this file instead of stdout")
+    args = parser.parse_args()
+    
+    if not os.environ.get("DISPLAY"):
+        from bench_complex_gui import start_xvfb
+        start_xvfb()
+    
+    import tkinter as tk
+    from complex_gui_app import ComplexGUIApp, TraceReplayer
+    
+    root = tk.Tk()
+    app = ComplexGUIApp(root, enable_frame_stats=True)
+    root.update()
+    results = []
+    
+    def on_complete(result):
+        results.append(result)
+        if len(results) < args.repeat:
+            replay()
+        else:
+            root.quit()
+    
+    def replay():
+        TraceReplayer.load(app, args.trace, args.speed, on_complete).start()
+    
+    root.after(0, replay)
+    root.mainloop()
+    root.destroy()
+    
+    output = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as output_file:
+            output_file.write(output)
+    else:
+        print(output)
+    sys.exit(0)
+
+
+if __name__ == "__main__":
+    main()
@@ -5,34 +5,44 @@ import os
 os.environ['DISPLAY'] = ':99'
 
 try:
-    from complex_gui_app import ComplexGUIApp
+    from complex_gui_app import ComplexGUIApp, VirtualClock
     
     print("Testing Complex GUI Application...")
     
     root = tk.Tk()
-    app = ComplexGUIApp(root)
+    clock = VirtualClock()
+    app = ComplexGUIApp(root, clock=clock)
     
     print("✓ Application initialized successfully")
     print("✓ Sidebar created")
     print("✓ Animation engine initialized")
     print("✓ Views created (Home, Dashboard, Settings, About)")
     
+    clock.run_until_idle()
     root.update()
+    assert app.animation_engine.is_idle()
     
     print("✓ Initial render successful")
     
     for page in ["dashboard", "settings", "about", "home"]:
         app.navigate_to_page(page)
+        clock.run_until_idle()
         root.update()
+        assert app.current_view is app.views[page]
+        assert app.views[page].opacity == 1.0
         print(f"✓ Navigation to {page} successful")
     
     print("✓ Sidebar toggle test...")
     app.sidebar.toggle()
+    clock.run_until_idle()
     root.update()
+    assert app.sidebar.current_width == app.sidebar.collapsed_width
     print("✓ Sidebar collapsed successfully")
     
     app.sidebar.toggle()
+    clock.run_until_idle()
     root.update()
+    assert app.sidebar.current_width == app.sidebar.expanded_width
     print("✓ Sidebar expanded successfully")
     
     print("\n✅ All tests passed!")
@@ -0,0 +1,452 @@
+import json
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+
+try:
+    import complex_gui_app
+    import null_tk
+    from clocks import VirtualClock
+    from complex_gui_app import ComplexGUIApp
+    
+    print("Testing Complex GUI Application on the null Tk backend...")
+    
+    complex_gui_app.use_backend(null_tk)
+    
+    root = null_tk.Tk()
+    app = ComplexGUIApp(root, clock=root.clock)
+    root.clock.run_until_idle()
+    
+    assert app.current_view is app.views["home"]
+    assert root.log.counts["create"] > 0
+    print(f"✓ Application built without a display ({root.log.counts['create']} widgets)")
+    
+    clock = root.clock
+    fired = clock.after(0, lambda: None)
+    clock.run_until_idle()
+    clock.after_cancel(fired)
+    clock.after_cancel(10 ** 9)
+    queued = clock.after(10, lambda: None)
+    assert clock.pending() == 1
+    clock.after_cancel(queued)
+    clock.after_cancel(queued)
+    assert clock.pending() == 0
+    clock.run_until_idle()
+    assert clock.pending() == 0 and not clock.cancelled
+    print("✓ Virtual clock ignores cancels of fired or unknown callbacks")
+    
+    for page in ["dashboard", "settings", "about", "home"]:
+        app.navigate_to_page(page)
+        root.clock.run_until_idle()
+        assert app.current_view is app.views[page]
+        assert app.views[page].frame.winfo_ismapped()
+        print(f"✓ Navigation to {page} successful")
+    
+    pool_size = app.widget_pool.size()
+    created = root.log.counts["create"]
+    app.views["settings"].variables["Dark Mode"].set(True)
+    for page in ["settings", "about", "home"] * 5:
+        app.navigate_to_page(page)
+        root.clock.run_until_idle()
+    assert app.widget_pool.size() == pool_size
+    assert root.log.counts["create"] == created
+    assert not app.views["settings"].widgets and not app.views["about"].widgets
+    assert app.views["settings"].variables["Dark Mode"].get()
+    home_button = [widget for widget in app.views["home"].widgets if isinstance(widget, null_tk.Button)][0]
+    home_button.invoke()
+    root.clock.run_until_idle()
+    assert app.current_view is app.views["dashboard"]
+    print(f"✓ Spec views reused {pool_size} pooled widgets across 15 page switches")
+    
+    app.sidebar.toggle()
+    root.clock.run_until_idle()
+    assert app.sidebar.current_width == app.sidebar.collapsed_width
+    assert app.sidebar.frame.cget("width") == app.sidebar.collapsed_width
+    assert not app.sidebar.menu_items[0].text_label.winfo_ismapped()
+    print("✓ Sidebar collapsed successfully")
+    
+    app.sidebar.toggle()
+    root.clock.run_until_idle()
+    assert app.sidebar.current_width == app.sidebar.expanded_width
+    assert app.sidebar.menu_items[0].text_label.winfo_ismapped()
+    print("✓ Sidebar expanded successfully")
+    
+    assert len(app.icons.images) == 6 and all(app.icons.images.values())
+    assert app.sidebar.menu_items[0].icon_label.cget("image") is app.icons.get("🏠", 22, "white")
+    root.log.reset()
+    item = app.sidebar.menu_items[2]
+    item.frame.event_generate("<Enter>")
+    root.clock.run_until_idle()
+    assert item.get_current_bg() == item.hover_color
+    item.frame.event_generate("<Button-1>")
+    root.clock.run_until_idle()
+    assert app.current_view is app.views["settings"]
+    assert item.get_current_bg() == item.active_color
+    assert not root.log.counts["image create photo"] and not root.log.counts["put"]
+    print("✓ Hover and click handled through bindings without re-rendering icons")
+    
+    grid = app.views["data"]
+    grid.row_count = 50000
+    app.navigate_to_page("data")
+    while grid.store is None:
+        root.clock.run_next()
+    assert len(grid.store.lowered["name"]) == len(grid.store.columns["id"]) == grid.row_count
+    grid.canvas.configure(height=400)
+    grid.on_canvas_resize(null_tk.Event(grid.canvas, width=640, height=400))
+    assert len(grid.cell_items) == (400 - grid.header_height) // grid.row_height + 1
+    assert grid.canvas.itemcget(grid.cell_items[0][0], "text") == "0"
+    assert not grid.indexer.is_ready("value")
+    grid.sort_by("value")
+    assert grid.pending_sort == ("value", False) and grid.sort_column is None
+    assert grid.status_label.cget("text") == "Sorting..."
+    assert grid.canvas.itemcget("header-value", "text") == "Value ▲"
+    while grid.pending_sort:
+        root.clock.run_next()
+    assert grid.sort_column == "value" and not grid.indexer.is_ready("name")
+    assert grid.status_label.cget("text") == f"{grid.row_count:,} rows"
+    root.clock.run_until_idle()
+    assert all(grid.indexer.is_ready(name) for name, label, width in grid.grid_columns)
+    values = [grid.store.value("value", grid.displayed_row(i)) for i in range(100)]
+    assert values == sorted(values)
+    grid.sort_by("value")
+    assert grid.store.value("value", grid.displayed_row(0)) == max(grid.store.columns["value"])
+    grid.filter_entry.insert(0, "ada")
+    grid.on_filter_changed()
+    root.clock.run_until_idle()
+    ada_rows = grid.displayed_count()
+    grid.filter_entry.insert(null_tk.END, " 1")
+    grid.on_filter_changed()
+    root.clock.run_until_idle()
+    names = [grid.store.value("name", grid.displayed_row(i)) for i in range(grid.displayed_count())]
+    assert names and all(name.lower().startswith("ada 1") for name in names)
+    assert "ada" in grid.filter.cache and len(names) < ada_rows
+    grid.scroll_to(10 ** 9)
+    root.clock.run_until_idle()
+    assert grid.first_row == grid.displayed_count() - len(grid.cell_items) + 1
+    print(f"✓ Data grid sorted and filtered {grid.row_count:,} rows")
+    
+    palette = app.command_palette
+    palette.open()
+    palette.entry.insert(0, "dark")
+    palette.entry.event_generate("<KeyRelease>", keysym="k")
+    assert palette.results[0][0] == "Settings: Dark Mode"
+    palette.entry.event_generate("<Return>")
+    root.clock.run_until_idle()
+    assert app.current_view is app.views["settings"]
+    assert root.focus_widget is app.views["settings"].settings["Dark Mode"]
+    assert not palette.is_open
+    assert palette.index.search("dashbord")[0][0] == "Dashboard"
+    grid.filter_entry.event_generate("<Control-k>")
+    assert palette.is_open and grid.filter_entry.get() == "ada 1"
+    palette.entry.event_generate("<Control-k>")
+    assert not palette.is_open
+    root.event_generate("<Control-k>")
+    assert palette.is_open
+    palette.close()
+    root.clock.run_until_idle()
+    
+    for i in range(50000):
+        palette.add(f"Report {i:05d} {('Sales', 'Usage', 'Billing', 'Audit')[i % 4]}", "Page", lambda: None)
+    queries = ["rep", "report 1234", "usage", "billing 0", "audt", "home", "sal"]
+    start = time.perf_counter()
+    for query in queries * 20:
+        palette.index.search(query)
+    per_query = (time.perf_counter() - start) / (len(queries) * 20)
+    assert palette.index.search("report 01234")[0][0] == "Report 01234 Billing"
+    print(f"✓ Command palette searched {len(palette.index):,} entries in {per_query * 1e6:.0f}µs per query")
+    
+    app.sidebar.toggle()
+    app.navigate_to_page("dashboard")
+    root.clock.run_until_idle()
+    app.views["dashboard"].chart_canvas.configure(width=760)
+    app.views["dashboard"].redraw_chart(list(range(5000)))
+    app.views["dashboard"].set_stat("Revenue", "$99K")
+    root.clock.run_until_idle()
+    session_path = os.path.join(tempfile.mkdtemp(), "session.json")
+    store = complex_gui_app.SessionStore(session_path)
+    store.save_async(app.snapshot_state())
+    store.close()
+    session = complex_gui_app.SessionStore(session_path).load()
+    assert session["page"] == "dashboard" and session["sidebar_expanded"] is False
+    
+    assert session["dashboard"]["chart_size"] == [760, 300] and session["dashboard"]["series"][0] == 113
+    
+    decimations = []
+    decimate_max = complex_gui_app.decimate_max
+    
+    def counted_decimate(data, buckets):
+        if len(data) > buckets:
+            decimations.append(buckets)
+        return decimate_max(data, buckets)
+    
+    complex_gui_app.decimate_max = counted_decimate
+    warm_root = null_tk.Tk()
+    warm_app = ComplexGUIApp(warm_root, clock=warm_root.clock, session=session)
+    dashboard = warm_app.views["dashboard"]
+    assert warm_app.current_view is dashboard
+    assert warm_app.sidebar.current_width == warm_app.sidebar.collapsed_width
+    assert dashboard.stat_labels["Revenue"].cget("text") == "$99K"
+    assert list(dashboard.series_cache) == session["dashboard"]["series"]
+    assert len(dashboard.bar_items) == 113 and not decimations
+    warm_root.clock.run_until_idle()
+    complex_gui_app.decimate_max = decimate_max
+    assert dashboard.aggregates["max"] == 4999 and decimations == [113]
+    
+    stale = dict(session, dashboard=dict(session["dashboard"], aggregates=dict(session["dashboard"]["aggregates"], max=1)))
+    stale_root = null_tk.Tk()
+    stale_dashboard = ComplexGUIApp(stale_root, clock=stale_root.clock, session=stale).views["dashboard"]
+    assert min(stale_dashboard.bar_tops) < stale_dashboard.chart_top
+    stale_root.clock.run_until_idle()
+    assert min(stale_dashboard.bar_tops) == stale_dashboard.chart_top
+    print("✓ Session snapshot restored on warm start")
+    
+    broken = dict(session, dashboard={key: value for key, value in session["dashboard"].items() if key != "aggregates"})
+    cold_root = null_tk.Tk()
+    cold_app = ComplexGUIApp(cold_root, clock=cold_root.clock, session=broken)
+    cold_root.clock.run_until_idle()
+    assert cold_app.current_view is cold_app.views["home"]
+    assert cold_app.views["dashboard"].chart_data == [30, 50, 40, 70, 60, 80, 75, 90, 85, 95]
+    for malformed in [{"page": ["x"]}, {"sidebar_expanded": "no"}, {"dashboard": dict(session["dashboard"], data=["x"])}]:
+        malformed_root = null_tk.Tk()
+        malformed_app = ComplexGUIApp(malformed_root, clock=malformed_root.clock, session=dict(session, **malformed))
+        malformed_root.clock.run_until_idle()
+        assert malformed_app.current_view is malformed_app.views["home"] and malformed_app.sidebar.is_expanded
+        assert malformed_app.views["dashboard"].chart_data == [30, 50, 40, 70, 60, 80, 75, 90, 85, 95]
+    unwritable = complex_gui_app.SessionStore(os.path.join(session_path, "missing", "session.json"))
+    unwritable.close(app.snapshot_state())
+    print("✓ Malformed session fell back to a cold start and unwritable session path was ignored")
+    
+    dashboard.redraw_chart([(i * 7919) % 1000003 for i in range(1000000)])
+    canvas = dashboard.chart_canvas
+    item_count = len(canvas.items)
+    warm_root.log.reset()
+    start = time.perf_counter()
+    for x in range(40, 560):
+        canvas.event_generate("<Motion>", x=x, y=150)
+    warm_root.clock.advance(0.02)
+    canvas.event_generate("<Motion>", x=45, y=150)
+    warm_root.clock.run_until_idle()
+    hover_time = time.perf_counter() - start
+    assert warm_root.log.counts["coords"] == 2
+    label = canvas.itemcget(dashboard.tooltip, "text")
+    assert label.startswith("#1–") and canvas.itemcget(dashboard.tooltip, "state") == "normal"
+    canvas.event_generate("<Button-1>", x=45, y=150)
+    assert dashboard.selected_bar == 0
+    canvas.event_generate("<Leave>")
+    assert canvas.itemcget(dashboard.tooltip, "state") == "hidden"
+    assert len(canvas.items) == item_count + 1
+    print(f"✓ Chart hover over 1,000,000 points in {hover_time * 1e3:.1f}ms for 521 motion events")
+    
+    stream = dashboard.start_stream()
+    rng = random.Random(3)
+    
+    def feed(remaining):
+        stream.append(rng.uniform(0, 90))
+        if remaining > 1:
+            warm_root.after(1, feed, remaining - 1)
+    
+    drawn = []
+    render = stream.render
+    
+    def counted_render():
+        created = warm_root.log.counts["create rectangle"]
+        render()
+        drawn.append(warm_root.log.counts["create rectangle"] - created)
+    
+    stream.render = counted_render
+    warm_root.log.reset()
+    start = time.process_time()
+    warm_root.after(1, feed, 10000)
+    warm_root.clock.run_until_idle()
+    load = (time.process_time() - start) / 10.0
+    assert len(stream.buffer) == 10000 and stream.buffer.values()[-1] == stream.buffer.data[9999]
+    assert len(canvas.find_withtag("stream")) == len(stream.columns) == stream.max_columns
+    assert warm_root.log.counts["move"] == len([count for count in drawn if count]) <= len(drawn)
+    assert sum(drawn) == warm_root.log.counts["create rectangle"] == 10000 // stream.samples_per_column
+    assert not warm_root.log.counts["create line"]
+    ring = complex_gui_app.RingBuffer(5)
+    ring.extend(range(7))
+    ring.append(7)
+    assert list(ring.values()) == [3.0, 4.0, 5.0, 6.0, 7.0]
+    assert list(ring.window(5, 7)) == [5.0, 6.0]
+    print(f"✓ Streamed 1 kHz samples drawing {sum(drawn)} columns once each ({load:.1%} main-thread load)")
+    
+    engine = app.animation_engine
+    stats = engine.enable_instrumentation()
+    stalled = []
+    
+    def stall_once(progress):
+        if progress > 0.3 and not stalled:
+            stalled.append(progress)
+            root.clock.time += 0.05
+    
+    for i in range(3):
+        engine.animate(0.1, lambda progress: None, label=f"concurrent-{i}")
+    engine.animate(0.1, stall_once, label="concurrent-3")
+    root.clock.run_until_idle()
+    frames = stats.snapshot()["frame_interval_ms"]["count"]
+    assert all(stats.labels[f"concurrent-{i}"]["frames"] == frames for i in range(3))
+    assert stats.labels["concurrent-3"]["late_frames"] == 1
+    assert stats.late_frames == 1 and stats.dropped_frames == 2
+    engine.disable_instrumentation()
+    print(f"✓ Frame stats count {frames} engine frames and one late frame for 4 concurrent animations")
+    
+    rate_clock = VirtualClock()
+    rate_engine = complex_gui_app.AnimationEngine(root, rate_clock, 120)
+    frame_times = []
+    rate_engine.animate(1.0, lambda progress: frame_times.append(rate_clock.now()))
+    rate_clock.advance(0.5)
+    rate_engine.set_frame_rate(30)
+    rate_clock.run_until_idle()
+    gaps = [later - earlier for earlier, later in zip(frame_times, frame_times[1:])]
+    assert max(gaps) < 1 / 30 + 0.002 and abs(frame_times[-1] - 1.0) < 1 / 30
+    assert abs(gaps[-2] - 1 / 30) < 0.002
+    print(f"✓ Animation kept running after switching 120 Hz to 30 Hz mid-flight ({len(frame_times)} frames)")
+    
+    assert complex_gui_app.StartupTracer().span("disabled") is complex_gui_app.StartupTracer.null_span
+    tracer = complex_gui_app.StartupTracer(os.path.join(tempfile.mkdtemp(), "startup.json"))
+    with tracer.span("build"):
+        time.sleep(0.001)
+    tracer.mark("first mapped frame")
+    tracer.write()
+    with open(tracer.path, encoding="utf-8") as trace_file:
+        trace_events = json.load(trace_file)["traceEvents"]
+    phases = {event["name"]: event["ph"] for event in trace_events}
+    assert phases["build"] == "X" and phases["first mapped frame"] == "i"
+    assert all(event["ts"] >= 0 for event in trace_events if event["ph"] != "M")
+    assert [event["dur"] for event in trace_events if event["name"] == "build"][0] >= 1000
+    assert tracer.span("after write") is complex_gui_app.StartupTracer.null_span
+    
+    paint_tracer = complex_gui_app.StartupTracer(os.path.join(tempfile.mkdtemp(), "paint.json"))
+    app_tracer, complex_gui_app.startup_tracer = complex_gui_app.startup_tracer, paint_tracer
+    paint_root = null_tk.Tk()
+    complex_gui_app.trace_first_paint(paint_root)
+    for i in range(2):
+        paint_root.event_generate("<Map>")
+        paint_root.clock.run_until_idle()
+    complex_gui_app.startup_tracer = app_tracer
+    assert [name for name, start, end in paint_tracer.events] == ["first mapped frame", "startup"]
+    assert not paint_tracer.enabled and not paint_root.bind("<Map>")
+    print("✓ Startup tracer wrote a Chrome trace")
+    
+    record_root = null_tk.Tk()
+    record_app = ComplexGUIApp(record_root, clock=record_root.clock)
+    recorder = complex_gui_app.InteractionRecorder(record_app)
+    recorder.start()
+    item = record_app.sidebar.menu_items[2]
+    item.frame.event_generate("<Enter>")
+    item.text_label.event_generate("<Button-1>")
+    item.frame.event_generate("<Leave>")
+    record_app.sidebar.toggle_btn.invoke()
+    record_root.geometry("1000x600")
+    record_root.clock.run_until_idle()
+    recorder.stop()
+    trace_path = os.path.join(tempfile.mkdtemp(), "trace.json")
+    recorder.save(trace_path)
+    assert [event[1:] for event in recorder.events] == [["enter", 2], ["click", 2], ["leave", 2], ["toggle"], ["resize", 1000, 600]]
+    
+    replay_root = null_tk.Tk()
+    replay_app = ComplexGUIApp(replay_root, clock=replay_root.clock)
+    results = []
+    replayer = complex_gui_app.TraceReplayer.load(replay_app, trace_path, speed=0, on_complete=results.append)
+    dispatched = []
+    dispatch = replayer.dispatch
+    replayer.dispatch = lambda kind, *args: (dispatched.append([kind] + list(args)), dispatch(kind, *args))
+    replayer.start()
+    replay_root.clock.run_until_idle()
+    assert dispatched == [event[1:] for event in recorder.events]
+    assert results and results[0]["events"] == 5
+    assert replay_app.current_view is replay_app.views["settings"]
+    assert not replay_app.sidebar.is_expanded and replay_root.geometry() == "1000x600+0+0"
+    print("✓ Recorded interactions replayed through save and load")
+    
+    class FakeTkapp:
+        def call(self, *args):
+            if args[0] == "update":
+                time.sleep(0.02)
+                profiled_root.tk.call("after", "info")
+            else:
+                time.sleep(0.005)
+            return ""
+    
+    class FakeRoot:
+        def __init__(self):
+            self.tk = FakeTkapp()
+        
+        def after(self, ms, func):
+            return "after#1"
+    
+    class ProfiledWidget:
+        def __init__(self, master):
+            self.tk = master.tk
+        
+        def redraw(self):
+            return self.tk.call(".!canvas", "coords", 1)
+        
+        def refresh(self):
+            return self.tk.call("update")
+    
+    profiled_root = FakeRoot()
+    profiler = complex_gui_app.TclProfiler(profiled_root)
+    profiler.install()
+    widget = ProfiledWidget(profiled_root)
+    widget.redraw()
+    start = time.perf_counter()
+    widget.refresh()
+    refresh_ms = (time.perf_counter() - start) * 1000
+    rows = {(row["component"], row["method"].rsplit(".", 1)[-1], row["command"]): row for row in profiler.top()}
+    assert rows[("ProfiledWidget", "redraw", "<widget> coords")]["calls"] == 1
+    nested_ms = rows[("FakeTkapp", "call", "after info")]["total_ms"]
+    update_ms = rows[("ProfiledWidget", "refresh", "update")]["total_ms"]
+    assert update_ms >= 19 and nested_ms >= 4.5
+    assert refresh_ms - update_ms >= nested_ms * 0.9
+    profiler.uninstall()
+    widget.redraw()
+    assert sum(count for count, total in profiler.calls.values()) == 3
+    print("✓ Tcl profiler attributed calls to callers and excluded nested calls from self time")
+    
+    stall_log = os.path.join(tempfile.mkdtemp(), "stalls.log")
+    watchdog = complex_gui_app.StallWatchdog(
+        root, app.animation_engine, threshold=0.05, heartbeat_interval=0.01, capacity=2, log_path=stall_log
+    )
+    watchdog.main_thread_id = threading.get_ident()
+    app.animation_engine.animate(1.0, lambda progress: None, label="stall-test")
+    watchdog_thread = threading.Thread(target=watchdog.run, daemon=True)
+    watchdog_thread.start()
+    for i in range(3):
+        watchdog.last_heartbeat = time.monotonic() - 0.2
+        time.sleep(0.1)
+        watchdog.last_heartbeat = time.monotonic()
+        time.sleep(0.05)
+    watchdog.stop_event.set()
+    watchdog_thread.join()
+    root.clock.run_until_idle()
+    events = watchdog.get_events()
+    assert len(events) == 2
+    assert all(event["duration"] >= 0.25 and event["samples"] >= 1 for event in events)
+    assert events[-1]["animations"] == ["stall-test"]
+    assert any("test_null_backend.py" in line for line in events[-1]["stack"])
+    with open(stall_log, encoding="utf-8") as log_file:
+        logged = [json.loads(line) for line in log_file]
+    assert len(logged) == 3 and logged[-1] == events[-1]
+    print(f"✓ Watchdog recorded stalls of {events[-1]['duration'] * 1000:.0f}ms with the main thread stack")
+    
+    start = time.perf_counter()
+    count = 0
+    while time.perf_counter() - start < 0.5:
+        bench_root = null_tk.Tk(keep_entries=False)
+        ComplexGUIApp(bench_root, clock=bench_root.clock)
+        count += 1
+    print(f"✓ {count / (time.perf_counter() - start):.0f} app constructions per second")
+    
+    print("\n✅ All null backend tests passed!")
+    sys.exit(0)
+
+except Exception as e:
+    print(f"❌ Error: {e}")
+    import traceback
+    traceback.print_exc()
+    sys.exit(1)